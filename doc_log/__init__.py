@@ -1,21 +1,50 @@
 #!/usr/bin/env python3
 
+"""Smarter logging based on Python docstrings.
+
+Setting the environment variable `DOC_LOG_DISABLED=1` before `doc_log` is imported disables
+the `doc_log` decorator entirely, decorated functions are then returned unchanged.
+"""
 
-from datetime import datetime
-from inspect import FrameInfo, getmodule, stack
 from functools import wraps
-from typing import Optional
+from typing import Any, Optional
 import logging
+import os
+import sys
 
 from doc_log.parser import parse_docstring, _get_context_frame
 from doc_log.types import type_check_arguments, type_check_rtypes
 
-logging.basicConfig(
-    level=logging.INFO,
-    encoding="utf-8",
-    format="%(levelname)s :: %(asctime)s :: %(message)s",
-)
 LOGGER = logging.getLogger()
+if not LOGGER.handlers:
+    # Only configure logging if the application has not already done so.
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(levelname)s :: %(asctime)s :: %(message)s",
+    )
+
+_DISABLED = os.environ.get("DOC_LOG_DISABLED") == "1"
+
+_PARAMETER_TYPE_MESSAGE = "(doc-log :: %s:%s:%s) parameter: `%s` was not of expected type: `%s` was actually `%s`"
+_RETURN_TYPE_MESSAGE = "(doc-log :: %s:%s:%s) return value was not of expected type: `%s` was actually `%s`"
+_MISSING_SECTION_MESSAGE = "(doc-log :: %s:%s:%s) `type_check` was defined, however, no `%s` section could be parsed."
+
+
+def _emit_type_error(message: str, should_raise: bool, *arguments: Any) -> None:
+    """Report a failed type check, either by raising or by logging a warning.
+
+    :param message: The message template to report.
+    :type message: str
+    :param should_raise: If the failed type check should raise instead of warn.
+    :type should_raise: bool
+    :param arguments: The arguments to format the message template with.
+    :type arguments: Any
+    :raises TypeError: If `should_raise` is set.
+    """
+    if should_raise:
+        raise TypeError(message % arguments)
+
+    LOGGER.warning(message, *arguments)
 
 
 def doc_log(
@@ -24,125 +53,111 @@ def doc_log(
     _active_type_check: Optional[bool] = None,
 ):
     def decorator(func):
+        if (
+            _DISABLED
+            or not type_check
+            or (not func.__doc__ and dialect.lower() != "annotations")
+        ):
+            # Nothing is checked or logged for the function, skip the wrapper entirely.
+            return func
+
+        # The docstring and dialect are fixed once decorated, so the rules are only
+        # parsed on the first call and reused for every following call.
+        rules, types, rtypes = None, None, None
+        _func_name = func.__name__
+        _func_file = getattr(sys.modules.get(func.__module__), "__file__", None)
+        _func_lineno = func.__code__.co_firstlineno + 1
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if func.__doc__:
+            nonlocal rules, types, rtypes
+            if rules is None:
                 rules = parse_docstring(_function=func, dialect=dialect)
                 # TODO: Add validation checks for the rules to ensure expected format.
+                types, rtypes = rules.get("types"), rules.get("rtypes")
+
+            # Only the outermost results are reported, unless they are all logged for debugging.
+            _debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
+            _should_raise = bool(_active_type_check) or LOGGER.level >= logging.ERROR
+            _frame = _get_context_frame()
+            if types is not None:
+                _type_check_arguments_results = type_check_arguments(
+                    types=types,
+                    arguments=args,
+                    parameters=kwargs,
+                    early_exit=not _debug_enabled,
+                )
 
-                _frame = _get_context_frame().frame
-                if type_check:
-                    if "types" in rules:
-                        _type_check_arguments_results = type_check_arguments(
-                            types=rules["types"],
-                            arguments=args,
-                            parameters=kwargs.copy(),  # A copy is necessary as this might be modified.
-                        )
-
-                        for (
-                            parameter,
-                            section_item_result,
-                        ) in _type_check_arguments_results.items():
-                            if not section_item_result.result:
-                                if LOGGER.level >= logging.ERROR or _active_type_check:
-                                    raise TypeError(
-                                        "(doc-log :: {!s}:{!s}:{!s}) parameter: `{!s}` was not of expected type: `{!s}` was actually `{!s}`".format(
-                                            _frame.f_code.co_name,
-                                            func.__code__.co_firstlineno
-                                            + 1
-                                            + section_item_result.item.lineno,
-                                            _frame.f_lineno,
-                                            parameter,
-                                            section_item_result.expected,
-                                            section_item_result.actual,
-                                        )
-                                    )
-                                else:
-                                    LOGGER.warning(
-                                        "(doc-log :: {!s}:{!s}:{!s}) parameter: `{!s}` was not of expected type: `{!s}` was actually `{!s}`".format(
-                                            _frame.f_code.co_name,
-                                            func.__code__.co_firstlineno
-                                            + 1
-                                            + section_item_result.item.lineno,
-                                            _frame.f_lineno,
-                                            parameter,
-                                            section_item_result.expected,
-                                            section_item_result.actual,
-                                        )
-                                    )
-                    else:
-                        LOGGER.warning(
-                            "(doc-log :: {!s}:{!s}:{!s}) `type_check` was defined, however, no `types` section could be parsed.".format(
-                                _frame.f_code.co_name,
-                                func.__code__.co_firstlineno + 1,
-                                _frame.f_lineno,
-                            )
-                        )
-
-                    LOGGER.info(
-                        "(doc-log :: {!s}:{!s}:{!s}) function: `{!s}` called from `{!s}` at: `{!s}`".format(
-                            _frame.f_code.co_name,
-                            func.__code__.co_firstlineno + 1,
-                            _frame.f_lineno,
-                            func.__name__,
-                            getmodule(func).__file__,
-                            datetime.now().isoformat(),
-                        )
+                for section_item_result in _type_check_arguments_results.values():
+                    if section_item_result.result:
+                        continue
+
+                    _emit_type_error(
+                        _PARAMETER_TYPE_MESSAGE,
+                        _should_raise,
+                        _frame.f_code.co_name,
+                        _func_lineno + section_item_result.item.lineno,
+                        _frame.f_lineno,
+                        section_item_result.item.name,
+                        section_item_result.expected,
+                        section_item_result.actual,
                     )
-                    LOGGER.debug(
-                        "(doc-log :: {!s}:{!s}:{!s}) function: `{!s}` was passed arguments: `{!r}` and keyword arguments: `{!r}`".format(
-                            _frame.f_code.co_name,
-                            func.__code__.co_firstlineno + 1,
-                            _frame.f_lineno,
-                            func.__name__,
-                            args,
-                            kwargs,
-                        )
+            else:
+                LOGGER.warning(
+                    _MISSING_SECTION_MESSAGE,
+                    _frame.f_code.co_name,
+                    _func_lineno,
+                    _frame.f_lineno,
+                    "types",
+                )
+
+            if LOGGER.isEnabledFor(logging.INFO):
+                LOGGER.info(
+                    "(doc-log :: %s:%s:%s) function: `%s` called from `%s`",
+                    _frame.f_code.co_name,
+                    _func_lineno,
+                    _frame.f_lineno,
+                    _func_name,
+                    _func_file,
+                )
+            if _debug_enabled:
+                LOGGER.debug(
+                    "(doc-log :: %s:%s:%s) function: `%s` was passed arguments: `%r` and keyword arguments: `%r`",
+                    _frame.f_code.co_name,
+                    _func_lineno,
+                    _frame.f_lineno,
+                    _func_name,
+                    args,
+                    kwargs,
+                )
+            _function_return_value = func(*args, **kwargs)
+
+            # The calling frame is the same after the call, `_frame` is reused as is.
+            if rtypes is not None:
+                _type_check_rtypes_result = type_check_rtypes(
+                    rtypes=rtypes,
+                    results=_function_return_value,
+                    early_exit=not _debug_enabled,
+                )
+
+                if not _type_check_rtypes_result.result:
+                    _emit_type_error(
+                        _RETURN_TYPE_MESSAGE,
+                        _should_raise,
+                        _frame.f_code.co_name,
+                        _func_lineno + _type_check_rtypes_result.item.lineno,
+                        _frame.f_lineno,
+                        _type_check_rtypes_result.expected,
+                        _type_check_rtypes_result.actual,
                     )
-                _function_return_value = func(*args, **kwargs)
-
-                _frame = _get_context_frame().frame
-                if type_check:
-                    if "rtypes" in rules:
-                        _type_check_rtypes_result = type_check_rtypes(
-                            rtypes=rules["rtypes"], results=_function_return_value
-                        )
-
-                        if not _type_check_rtypes_result.result:
-                            if LOGGER.level >= logging.ERROR or _active_type_check:
-                                raise TypeError(
-                                    "(doc-log :: {!s}:{!s}:{!s}) return value was not of expected type: `{!s}` was actually `{!s}`".format(
-                                        _frame.f_code.co_name,
-                                        func.__code__.co_firstlineno
-                                        + 1
-                                        + _type_check_rtypes_result.item.lineno,
-                                        _frame.f_lineno,
-                                        _type_check_rtypes_result.expected,
-                                        _type_check_rtypes_result.actual,
-                                    )
-                                )
-                            else:
-                                LOGGER.warning(
-                                    "(doc-log :: {!s}:{!s}:{!s}) return value was not of expected type: `{!s}` was actually `{!s}`".format(
-                                        _frame.f_code.co_name,
-                                        func.__code__.co_firstlineno
-                                        + 1
-                                        + _type_check_rtypes_result.item.lineno,
-                                        _frame.f_lineno,
-                                        _type_check_rtypes_result.expected,
-                                        _type_check_rtypes_result.actual,
-                                    )
-                                )
-                    else:
-                        LOGGER.warning(
-                            "(doc-log :: {!s}:{!s}:{!s}) `type_check` was defined, however, no `rtypes` section could be parsed.".format(
-                                _frame.f_code.co_name,
-                                func.__code__.co_firstlineno + 1,
-                                _frame.f_lineno,
-                            )
-                        )
             else:
-                _function_return_value = func(*args, **kwargs)
+                LOGGER.warning(
+                    _MISSING_SECTION_MESSAGE,
+                    _frame.f_code.co_name,
+                    _func_lineno,
+                    _frame.f_lineno,
+                    "rtypes",
+                )
 
             return _function_return_value
 
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from re import compile
-from inspect import FrameInfo, getmodule, signature, stack
-from dataclasses import dataclass
-from pathlib import Path
-from types import CodeType
+from re import Pattern, compile
+from inspect import Parameter, signature
+from dataclasses import dataclass, field
+from functools import lru_cache
+from os.path import dirname
+from types import CodeType, FrameType, SimpleNamespace
 from typing import (
     Callable,
     Dict,
@@ -16,21 +17,36 @@ from typing import (
     Any,
     _SpecialForm,
     TypeVar,
+    get_type_hints,
 )
+import builtins
 import logging
+import sys
 import typing
 
 LOGGER = logging.getLogger()
 
+_PACKAGE_DIRECTORY = dirname(__file__)
 
-@dataclass
+# Slotted dataclasses are only available from Python 3.10, older versions fall back to a `__dict__`.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_CONTAINER_TYPE_PATTERN = compile(r"[a-zA-Z0-9\_]*(?=\[)")
+_NESTED_TYPES_PATTERN = compile(r"(?<=\[).*")
+_TYPE_DELIMITERS_PATTERN = compile(r"[\[\],]")
+
+# Marks attributes that are not defined at all, as opposed to defined as `None`.
+_MISSING = object()
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class PatternDescriptor:
     """Describes the section pattern and the display value that represents the section."""
 
     pattern: str
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class SectionPattern:
     """Describes the section syntax, i.e the name of the section like arguments, raises etc.
     The name of the parameter if applicable for example i in the following example, this can be None
@@ -45,39 +61,47 @@ class SectionPattern:
     section: PatternDescriptor
     value: str
     name: Optional[str] = None
+    value_compiled: Optional[Pattern] = field(init=False, repr=False, compare=False)
+    name_compiled: Optional[Pattern] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self: "SectionPattern") -> None:
+        # The section patterns are shared module constants, so they are frozen once compiled.
+        object.__setattr__(
+            self,
+            "value_compiled",
+            compile(self.value) if self.value is not None else None,
+        )
+        object.__setattr__(
+            self, "name_compiled", compile(self.name) if self.name is not None else None
+        )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SectionItem:
     """Describes the actual section item, that is the name (if applicable) and the value for the item."""
 
     value: str
-    _subitems: Optional[List["SectionItem"]]
+    _subitems: Optional[Tuple["SectionItem", ...]]
     name: Optional[str] = None
     lineno: int = 0
+    _rendered: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __str__(self: "SectionItem") -> str:
-        def _unfold(items: List["SectionItem"], _result: str = "") -> str:
-            for item in items:
-                if item._subitems:
-                    _result = "{!s}[{!s}]".format(
-                        item.value, _unfold(item._subitems, _result=_result)
-                    )
-                else:
-                    if not _result:
-                        _result = item.value
-                    else:
-                        _result = "{!s}, {!s}".format(_result, item.value)
-
-            return _result
-
-        if self._subitems:
-            return "{!s}[{!s}]".format(self.value, _unfold(self._subitems))
+        # The subitems are a tuple that is built before the item, so the rendering is kept.
+        if self._rendered is None:
+            if self._subitems:
+                self._rendered = "{!s}[{!s}]".format(
+                    self.value, ", ".join(str(item) for item in self._subitems)
+                )
+            else:
+                self._rendered = self.value
 
-        return self.value
+        return self._rendered
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Section:
     """Describes the actual section, that is the name of the section and the items belonging to the section."""
 
@@ -87,820 +111,1087 @@ class Section:
     lineno: int
 
 
-def _get_context_frame() -> FrameInfo:
-    for frame in stack():
-        if Path(frame.filename).parts[:-1] != Path(__file__).parts[:-1]:
-            return frame
+def _compile_sections_pattern(sections: Dict[str, SectionPattern]) -> Pattern:
+    """Combine the section patterns into a single pattern with one named group per section,
+    the name of the matched group is the name of the matched section. The leading `^` of each
+    pattern is dropped since the combined pattern is only used with `match`.
 
+    :param sections: The sections to combine the patterns of.
+    :type sections: Dict[str, SectionPattern]
+    :return: The combined pattern for all sections.
+    :rtype: Pattern
+    """
+    return compile(
+        "|".join(
+            "(?P<{!s}>{!s})".format(section, patterns.section.pattern.lstrip("^"))
+            for section, patterns in sections.items()
+        )
+    )
 
-def parse_docstring(_function: Callable, dialect: str) -> Dict[str, str]:
-    """Parse the docstring and extract the rules related to doc-log.
 
-    :param _function: The called function that should be inspected for docstring and type hints.
+# Most of the styles were taken from PEP257,
+# https://stackoverflow.com/questions/3898572/what-is-the-standard-python-docstring-format
+_PEP257_SECTIONS = {
+    "arguments": SectionPattern(
+        section=PatternDescriptor(pattern=r"^Arguments:$"),
+        name=r" .*(?=:)",
+        value=r"--\ .*$",
+    ),
+    "keywords": SectionPattern(
+        section=PatternDescriptor(pattern=r"^Keyword\ Arguments:$"),
+        name=r" .*(?=:)",
+        value=r"--\ .*$",
+    ),
+    "raises": SectionPattern(
+        section=PatternDescriptor(pattern=r"^Exceptions:$"),
+        name=r" .*(?=:)",
+        value=r"--\ .*$",
+    ),
+    "returns": SectionPattern(
+        section=PatternDescriptor(pattern=r"^Returns:$"),
+        name=r" .*(?=:)",
+        value=r"--\ .*$",
+    ),
+    "types": SectionPattern(
+        section=PatternDescriptor(pattern=r"^Types:$"),
+        name=r" .*(?=:)",
+        value=r"--\ .*$",
+    ),
+    "rtypes": SectionPattern(
+        section=PatternDescriptor(pattern=r"^Return Type:$"),
+        name=r" .*(?=:)",
+        value=r"--\ .*$",
+    ),
+}
+_PEP257_SECTIONS_PATTERN = _compile_sections_pattern(_PEP257_SECTIONS)
+
+_PEP257_SECTIONS_ONELINE = {
+    "arguments": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:arguments"),
+        name=r"(?<= ).*(?= --)",
+        value=r"(?<=-- ).*$",
+    ),
+    "keywords": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:keywords"),
+        name=r"(?<= ).*(?= --)",
+        value=r"(?<=-- ).*$",
+    ),
+    "types": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:types"),
+        name=r"(?<= ).*(?= --)",
+        value=r"(?<=-- ).*$",
+    ),
+    "raises": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:raises"),
+        name=r"(?<= ).*(?= --)",
+        value=r"(?<=-- ).*$",
+    ),
+    "returns": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:returns"),
+        name=r"(?<= ).*(?= --)",
+        value=r"(?<=:returns ).*$",
+    ),
+    "rtypes": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:rtypes"),
+        name=r"(?<= ).*(?= --)",
+        value=r"(?<=:rtypes ).*$",
+    ),
+}
+
+_EPYTEXT_SECTIONS = {
+    "arguments": SectionPattern(
+        section=PatternDescriptor(pattern=r"^@param"),
+        name=r"(?<= ).*(?=:)",
+        value=r"(?<=:) .*$",
+    ),
+    "types": SectionPattern(
+        section=PatternDescriptor(pattern=r"^@type"),
+        name=r"(?<= ).*(?=:)",
+        value=r"(?<=:) .*$",
+    ),
+    "raises": SectionPattern(
+        section=PatternDescriptor(pattern=r"^@raise"),
+        name=r"(?<= ).*(?=:)",
+        value=r"(?<=:) .*$",
+    ),
+    "returns": SectionPattern(
+        section=PatternDescriptor(pattern=r"^@return"),
+        value=r"(?<=:) .*$",
+    ),
+    "rtypes": SectionPattern(
+        section=PatternDescriptor(pattern=r"^@rtype"),
+        value=r"(?<=:) .*$",
+    ),
+}
+_EPYTEXT_SECTIONS_PATTERN = _compile_sections_pattern(_EPYTEXT_SECTIONS)
+
+_REST_SECTIONS = {
+    "arguments": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:param"),
+        name=r"(?<= ).*(?=:)",
+        value=r"(?<=: ).*$",
+    ),
+    "types": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:type"),
+        name=r"(?<= ).*(?=:)",
+        value=r"(?<=: ).*$",
+    ),
+    "returns": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:return"),
+        value=r"(?<=: ).*$",
+    ),
+    "rtypes": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:rtype"),
+        value=r"(?<=: ).*$",
+    ),
+}
+_REST_SECTIONS_PATTERN = _compile_sections_pattern(_REST_SECTIONS)
+
+_GOOGLE_SECTIONS = {
+    "arguments": SectionPattern(
+        section=PatternDescriptor(pattern=r"^Args:$"),
+        name=r"(?<= ).*(?=:)",
+        value=r"(?<=: ).*$",
+    ),
+    "types": SectionPattern(
+        section=PatternDescriptor(pattern=r"^Types:$"),
+        name=r"(?<= ).*(?=:)",
+        value=r"(?<=: ).*$",
+    ),
+    "raises": SectionPattern(
+        section=PatternDescriptor(pattern=r"^Raises:$"),
+        name=r"(?<= ).*(?=:)",
+        value=r"(?<=: ).*$",
+    ),
+    "returns": SectionPattern(
+        section=PatternDescriptor(pattern=r"^Returns:$"),
+        value=r"(?<=: ).*$",
+    ),
+    "rtypes": SectionPattern(
+        section=PatternDescriptor(pattern=r"^Return Type:$"),
+        value=r"(?<=: ).*$",
+    ),
+}
+_GOOGLE_SECTIONS_PATTERN = _compile_sections_pattern(_GOOGLE_SECTIONS)
+
+_GOOGLE_SECTIONS_ONELINE = {
+    "arguments": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:arguments"),
+        name=r"(?<= ).*(?=:)",
+        value=r"(?<=: ).*$",
+    ),
+    "types": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:types"),
+        name=r"(?<= ).*(?=:)",
+        value=r"(?<=: ).*$",
+    ),
+    "raises": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:raises"),
+        name=r"(?<= ).*(?=:)",
+        value=r"(?<=: ).*$",
+    ),
+    "returns": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:returns"),
+        name=r"(?<= ).*(?=:)",
+        value=r"(?<=:returns ).*$",
+    ),
+    "rtypes": SectionPattern(
+        section=PatternDescriptor(pattern=r"^:rtype"),
+        name=r"(?<= ).*(?=:)",
+        value=r"(?<=:rtypes ).*$",
+    ),
+}
+
+# Every section pattern is anchored at the start of the line, lines that do not begin with
+# one of these characters can never start a section and are skipped without a regex search.
+_SECTIONS_FIRST_CHARACTERS = frozenset(
+    patterns.section.pattern.lstrip("^")[0]
+    for sections in (
+        _PEP257_SECTIONS,
+        _EPYTEXT_SECTIONS,
+        _REST_SECTIONS,
+        _GOOGLE_SECTIONS,
+    )
+    for patterns in sections.values()
+)
+
+
+def _typing_type_name(name: str) -> str:
+    """Get the name a `typing` type hint is checked against, generic aliases such as `List`
+    are checked against their origin `list` while special forms such as `Union` keep their name.
+
+    :param name: The name of the type hint in the `typing` module.
+    :type name: str
+    :return: The name to check values against.
+    :rtype: str
+    """
+    type_hint = getattr(typing, name)
+    if isinstance(type_hint, (_SpecialForm, TypeVar)):
+        return name
+
+    if hasattr(type_hint, "__origin__"):
+        return getattr(type_hint.__origin__, "__name__", name)
+
+    if isinstance(type_hint, type):
+        return type_hint.__name__
+
+    return name
+
+
+# The names are resolved once, `_sanitize_type_hint` then only needs a dictionary lookup.
+_TYPING_TYPE_NAMES = {name: _typing_type_name(name) for name in dir(typing)}
+_BUILTIN_TYPE_NAMES = {
+    name: type(value).__name__ if value is None else value.__name__
+    for name, value in vars(builtins).items()
+    if value is None or hasattr(value, "__name__")
+}
+# Resolved signature type hints contain the type of `None` rather than `None` itself.
+_BUILTIN_TYPE_NAMES["NoneType"] = "NoneType"
+
+
+def _get_context_frame() -> FrameType:
+    """Get the first frame outside of the `doc-log` package, i.e the frame that called into `doc-log`.
+    Only walks the frame objects directly instead of building the full stack with source context.
+
+    :return: The first frame outside of the `doc-log` package.
+    :rtype: FrameType
+    """
+    frame = sys._getframe(1)
+    while frame is not None and dirname(frame.f_code.co_filename) == _PACKAGE_DIRECTORY:
+        frame = frame.f_back
+
+    return frame
+
+
+def _get_module_file(_function: Callable) -> Optional[str]:
+    """Get the file of the module the function was defined in, used for the log messages.
+    Modules that are not imported or have no file, e.g `__main__` in a REPL, have no file.
+
+    :param _function: The function to get the module file for.
     :type _function: Callable
-    :param dialect: The dialect of the docstring to parse.
-    :type dialect: str
-    :returns: The rules extracted from the docstring.
-    :rtype: Dict[str, str]
+    :return: The file of the module if it exists.
+    :rtype: Optional[str]
     """
-    _frame = _get_context_frame().frame
-    LOGGER.debug(
-        "(doc-log :: {!s}:{!s}:{!s}) parsing docstring with dialect: `{!s}` from function: `{!s}` in `{!s}`".format(
-            _frame.f_code.co_name,
-            _function.__code__.co_firstlineno + 1,
-            _frame.f_lineno,
-            dialect,
-            _function.__name__,
-            getmodule(_function).__file__,
-        )
-    )
+    return getattr(sys.modules.get(_function.__module__), "__file__", None)
 
-    def _parse_section_indexes(
-        docstring: Dict[int, str],
-        sections: Dict[str, SectionPattern],
-    ) -> Dict[int, str]:
-        """Generate the indexes at which each section begins, and return the results.
-
-        :param docstring: The docstring to parse the section indexes from.
-        :type docstring: List[str]
-        :param sections: The sections that should be parsed from the docstring if they exist.
-        :type sections: Dict[str, SectionPattern]
-        :return: The section indexes that were identified from the provided sections.
-        :rtype: Dict[int, str]
-        """
-        _section_indexes = {}
-        for index, line in docstring.items():
-            docstring[index] = line.strip()
-            for section, patterns in sections.items():
-                if (
-                    compile(patterns.section.pattern).search(docstring[index])
-                    is not None
-                ):
-                    _section_indexes[index] = section
-
-        return _section_indexes
-
-    def _sanitize_type_hint(type_hint: str, lineno: int = 0) -> str:
-        """Sanitize a given type hint into a common parseable format.
-        This is mostly to ensure that special types such as `None` whose name is `NoneType`
-        can be handled by the library.
-
-        :param type_hint: The type hint to sanitize.
-        :type type_hint: str
-        :return: The sanitized type hint.
-        :rtype: str
-        """
-
-        if hasattr(typing, type_hint):
-            if not isinstance(getattr(typing, type_hint), (_SpecialForm, TypeVar)):
-                type_hint = getattr(typing, type_hint).__origin__.__name__
-        elif type_hint in globals()["__builtins__"]:
-            type_hint = globals()["__builtins__"][type_hint]
-            if type_hint is None:
-                type_hint = type(type_hint)
-
-            type_hint = type_hint.__name__
-        elif type_hint in _frame.f_globals:
-            type_hint = _frame.f_globals[type_hint].__name__
-        else:
-            if type_hint != "_empty":
-                LOGGER.warning(
-                    "(doc-log :: {!s}:{!s}:{!s}) unknown type: `{!r}` provided, treating as literal.".format(
-                        _frame.f_code.co_name,
-                        _function.__code__.co_firstlineno + 1 + lineno,
-                        _frame.f_lineno,
-                        type_hint,
-                    )
-                )
 
-        return type_hint
-
-    def _collect_sections(
-        docstring: Dict[int, str],
-        section_indexes: Dict[int, str],
-        sections: Dict[str, SectionPattern],
-    ) -> Dict[str, Section]:
-        """Parse and collect all section items and define the name (if available) and the value of item.
-        Then group all the items in their respective sections.
-
-        :param docstring: The docstring to parse the section items from.
-        :type docstring: List[str]
-        :param section_indexes: The indexes defining where each item begins.
-        :type section_indexes: Dict[int, str]
-        :param sections: The sections that define each sections patterns.
-        :type sections: Dict[str, SectionPattern]
-        :return: The collected section items aggregated in their respective sections.
-        :rtype: Dict[str, Section]
-        """
-        _collected_sections = {
-            key: Section(
-                section=key, items=[], _function=_function.__code__, lineno=index
-            )
-            for index, key in section_indexes.items()
-        }
-        for index in sorted(section_indexes):
-            name = None
-            if sections[section_indexes[index]].name is not None:
-                name = compile(sections[section_indexes[index]].name).search(
-                    docstring[index]
-                )
+def _parse_section_indexes(
+    docstring: Dict[int, str],
+    sections_pattern: Pattern,
+) -> Dict[int, str]:
+    """Generate the indexes at which each section begins, and return the results.
 
-                name = name.group().strip() if name is not None else None
+    :param docstring: The stripped docstring lines to parse the section indexes from.
+    :type docstring: Dict[int, str]
+    :param sections_pattern: The combined pattern of the sections that should be parsed from the docstring if they exist.
+    :type sections_pattern: Pattern
+    :return: The section indexes that were identified from the provided sections, in ascending order.
+    :rtype: Dict[int, str]
+    """
+    _section_indexes = {}
+    _match_section = sections_pattern.match
+    for index, line in docstring.items():
+        if line[0] not in _SECTIONS_FIRST_CHARACTERS:
+            continue
 
-            value = None
-            if sections[section_indexes[index]].value is not None:
-                value = compile(sections[section_indexes[index]].value).search(
-                    docstring[index]
-                )
+        _match = _match_section(line)
+        if _match is not None:
+            _section_indexes[index] = _match.lastgroup
 
-                value = value.group().strip() if value is not None else None
+    return _section_indexes
 
-            _collected_sections[section_indexes[index]].items.append(
-                SectionItem(value=value, name=name, _subitems=[], lineno=index + 1)
-            )
 
-        LOGGER.debug(
-            "(doc-log :: {!s}:{!s}:{!s}) parsed sections: `{!r}` from function: `{!s}` in `{!s}`".format(
+def _sanitize_type_hint(
+    type_hint: str, _function: Callable, _frame: FrameType, lineno: int = 0
+) -> str:
+    """Sanitize a given type hint into a common parseable format.
+    This is mostly to ensure that special types such as `None` whose name is `NoneType`
+    can be handled by the library.
+
+    :param type_hint: The type hint to sanitize.
+    :type type_hint: str
+    :param _function: The called function that should be inspected for docstring and type hints.
+    :type _function: Callable
+    :param _frame: The frame that called into `doc-log`, used for the log messages.
+    :type _frame: FrameType
+    :param lineno: The line number in the docstring, defaults to 0
+    :type lineno: int, optional
+    :return: The sanitized type hint.
+    :rtype: str
+    """
+
+    if type_hint in _TYPING_TYPE_NAMES:
+        type_hint = _TYPING_TYPE_NAMES[type_hint]
+    elif type_hint in _BUILTIN_TYPE_NAMES:
+        type_hint = _BUILTIN_TYPE_NAMES[type_hint]
+    elif type_hint in _frame.f_globals:
+        type_hint = _frame.f_globals[type_hint].__name__
+    else:
+        if type_hint != "_empty":
+            LOGGER.warning(
+                "(doc-log :: %s:%s:%s) unknown type: `%r` provided, treating as literal.",
                 _frame.f_code.co_name,
-                _function.__code__.co_firstlineno + 1,
+                _function.__code__.co_firstlineno + 1 + lineno,
                 _frame.f_lineno,
-                list(_collected_sections.keys()),
-                _function.__name__,
-                getmodule(_function).__file__,
+                type_hint,
             )
+
+    return type_hint
+
+
+def _collect_sections(
+    docstring: Dict[int, str],
+    section_indexes: Dict[int, str],
+    sections: Dict[str, SectionPattern],
+    _function: Callable,
+    _frame: FrameType,
+) -> Dict[str, Section]:
+    """Parse and collect all section items and define the name (if available) and the value of item.
+    Then group all the items in their respective sections.
+
+    :param docstring: The docstring to parse the section items from.
+    :type docstring: List[str]
+    :param section_indexes: The indexes defining where each item begins.
+    :type section_indexes: Dict[int, str]
+    :param sections: The sections that define each sections patterns.
+    :type sections: Dict[str, SectionPattern]
+    :param _function: The called function that should be inspected for docstring and type hints.
+    :type _function: Callable
+    :param _frame: The frame that called into `doc-log`, used for the log messages.
+    :type _frame: FrameType
+    :return: The collected section items aggregated in their respective sections.
+    :rtype: Dict[str, Section]
+    """
+    _collected_sections = {}
+    for index, section in section_indexes.items():
+        # Each section reports the line of its last item.
+        if section in _collected_sections:
+            _collected_sections[section].lineno = index
+        else:
+            _collected_sections[section] = Section(
+                section=section, items=[], _function=_function.__code__, lineno=index
+            )
+
+        section_pattern = sections[section]
+        line = docstring[index]
+
+        name = None
+        if section_pattern.name_compiled is not None:
+            name = section_pattern.name_compiled.search(line)
+            name = name.group().strip() if name is not None else None
+
+        value = None
+        if section_pattern.value_compiled is not None:
+            value = section_pattern.value_compiled.search(line)
+            value = value.group().strip() if value is not None else None
+
+        _collected_sections[section].items.append(
+            SectionItem(value=value, name=name, _subitems=(), lineno=index + 1)
         )
-        return _collected_sections
-
-    def _convert_to_oneline_items(
-        docstring: Dict[int, str], sections: Dict[str, SectionPattern]
-    ) -> List[str]:
-        """Converts docstrings that are of a format similar to the example below into
-        docstrings that specify items on the same line making them easier to parse.
-
-        ```
-        ...
-        Arguments:
-            i: test argument
-        ```
-        Converts into the oneline item variant.
-        ```
-        ...
-        :arguments i: test argument
-        ```
-
-        :param docstring: The initial docstring to convert.
-        :type docstring: Dict[int, str]
-        :param sections: The initial sections to convert into oneline items.
-        :type sections: Dict[str, SectionPattern]
-        :return: The converted docstring.
-        :rtype: Dict[int, str]
-        """
-        _section_indexes = _parse_section_indexes(
-            docstring=docstring, sections=sections
+
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(
+            "(doc-log :: %s:%s:%s) parsed sections: `%r` from function: `%s` in `%s`",
+            _frame.f_code.co_name,
+            _function.__code__.co_firstlineno + 1,
+            _frame.f_lineno,
+            list(_collected_sections.keys()),
+            _function.__name__,
+            _get_module_file(_function),
         )
 
-        try:
-            _docstring = {
-                index: line
-                for index, line in docstring.items()
-                if index < min(_section_indexes.keys())
-            }
-        except ValueError:
-            raise ValueError(
-                "(doc-log :: {!s}:{!s}:{!s}) failed to parse the given docstring with dialect: {!s}".format(
-                    _frame.f_code.co_name,
-                    _function.__code__.co_firstlineno + 1,
-                    _frame.f_lineno,
-                    dialect,
-                )
-            )
+    return _collected_sections
 
-        indexes = list(sorted(_section_indexes.keys()))
-        for index in sorted(_section_indexes):
-            if not indexes:
-                break
 
-            for _index in range(
-                index + 1,
-                min([val for val in indexes if val != index])
-                if len(indexes) > 1
-                else max([val for val in docstring if val != index]) + 1,
-            ):
-                if _index not in docstring:
-                    continue
+def _convert_to_oneline_items(
+    docstring: Dict[int, str], section_indexes: Dict[int, str]
+) -> Tuple[Dict[int, str], Dict[int, str]]:
+    """Converts docstrings that are of a format similar to the example below into
+    docstrings that specify items on the same line making them easier to parse.
+    The section of each item is already known from its header, so the section indexes
+    of the converted items are returned alongside them instead of being parsed again.
 
-                _docstring[_index] = ":{!s} {!s}".format(
-                    _section_indexes[index], docstring[_index]
-                )
-            indexes = indexes[1:]
-
-        return _docstring
-
-    def _parse_type_hints(_function: Callable) -> Tuple[Section, Section]:
-        """Parse type hints from the function signature.
-
-        :param _function: The function to extract the type hints from.
-        :type _function: Callable
-        :return: The type hints if the function is inspectable.
-        :rtype: Tuple[Section, Section]
-        """
-
-        def _resolve_nested_type_hint(type_hint: Any, name: str = None) -> SectionItem:
-            """Recursively unwrap a nested type hint into `SectionItem` types,
-            with translated typing name.
-
-            :param type_hint: Nested type hint.
-            :type type_hint: Any
-            :param name: Name of parameter, usually the name for the initial type, defaults to None
-            :type name: str, optional
-            :return: `SectionItem` containing the nested `SectionItem` types.
-            :rtype: SectionItem
-            """
-            if hasattr(type_hint, "_name"):
-                if type_hint._name is None:
-                    # This is triggered when the type has no base type, i.e special types.
-                    # Since we keep these we need to explicitly convert them in a similar fashion.
-                    _start_index = str(type_hint).find(".")
-                    _end_index = str(type_hint).find("[")
-
-                    _item = SectionItem(
-                        value=_sanitize_type_hint(
-                            str(type_hint)[_start_index + 1 : _end_index]
-                        ),
-                        name=name,
-                        _subitems=[],
-                        lineno=0,
-                    )
-                else:
-                    _item = SectionItem(
-                        value=_sanitize_type_hint(type_hint._name),
-                        name=name,
-                        _subitems=[],
-                        lineno=0,
-                    )
+    ```
+    ...
+    Arguments:
+        i: test argument
+    ```
+    Converts into the oneline item variant.
+    ```
+    ...
+    :arguments i: test argument
+    ```
 
-                if hasattr(type_hint, "__args__"):
-                    for argument in type_hint.__args__:
-                        _item._subitems.append(_resolve_nested_type_hint(argument))
-            else:
-                if hasattr(type_hint, "__name__"):
-                    return SectionItem(
-                        value=_sanitize_type_hint(type_hint.__name__),
-                        name=name,
-                        _subitems=[],
-                        lineno=0,
-                    )
-                else:
-                    return SectionItem(
-                        value=_sanitize_type_hint(type(type_hint).__name__),
-                        name=name,
-                        _subitems=[],
-                        lineno=0,
-                    )
+    :param docstring: The initial docstring to convert.
+    :type docstring: Dict[int, str]
+    :param section_indexes: The indexes of the section headers in the initial docstring, at least one is required.
+    :type section_indexes: Dict[int, str]
+    :return: The converted section items and the section each of them belongs to.
+    :rtype: Tuple[Dict[int, str], Dict[int, str]]
+    """
+    indexes = list(section_indexes)
+    # Each section ends where the next one begins, the last one at the end of the docstring.
+    _item_indexes = {
+        _index: section_indexes[start]
+        for start, end in zip(indexes, indexes[1:] + [max(docstring) + 1])
+        for _index in range(start + 1, end)
+        if _index in docstring
+    }
+    # The prefix of each section is built once and shared by all of its items.
+    _prefixes = {
+        section: ":{!s} ".format(section) for section in section_indexes.values()
+    }
+    _docstring = {
+        index: _prefixes[section] + docstring[index]
+        for index, section in _item_indexes.items()
+    }
+
+    return _docstring, _item_indexes
+
+
+def _resolve_nested_type_hint(
+    type_hint: Any, _function: Callable, _frame: FrameType, name: str = None
+) -> SectionItem:
+    """Recursively unwrap a nested type hint into `SectionItem` types,
+    with translated typing name.
+
+    :param type_hint: Nested type hint.
+    :type type_hint: Any
+    :param _function: The called function that should be inspected for docstring and type hints.
+    :type _function: Callable
+    :param _frame: The frame that called into `doc-log`, used for the log messages.
+    :type _frame: FrameType
+    :param name: Name of parameter, usually the name for the initial type, defaults to None
+    :type name: str, optional
+    :return: `SectionItem` containing the nested `SectionItem` types.
+    :rtype: SectionItem
+    """
+    _type_name = getattr(type_hint, "_name", _MISSING)
+    if _type_name is _MISSING:
+        # Plain types such as builtins and custom classes have no nested types.
+        _type_name = getattr(type_hint, "__name__", None)
+        return SectionItem(
+            value=_sanitize_type_hint(
+                _type_name if _type_name is not None else type(type_hint).__name__,
+                _function=_function,
+                _frame=_frame,
+            ),
+            name=name,
+            _subitems=(),
+            lineno=0,
+        )
 
-            return _item
+    if _type_name is None:
+        # This is triggered when the type has no base type, i.e special types.
+        # Since we keep these we need to explicitly convert them in a similar fashion.
+        _type_hint = str(type_hint)
+        _type_name = _type_hint[_type_hint.find(".") + 1 : _type_hint.find("[")]
+
+    return SectionItem(
+        value=_sanitize_type_hint(_type_name, _function=_function, _frame=_frame),
+        name=name,
+        _subitems=tuple(
+            _resolve_nested_type_hint(argument, _function=_function, _frame=_frame)
+            for argument in getattr(type_hint, "__args__", ())
+        ),
+        lineno=0,
+    )
 
-        _signature = signature(_function)
 
-        return_types = Section(
-            section="rtypes", items=[], _function=_function.__code__, lineno=0
+def _resolve_annotation(
+    annotation: Any, name: str, _function: Callable, _frame: FrameType
+) -> Any:
+    """Resolve a single annotation from the function signature, string annotations such as those
+    from `from __future__ import annotations` are evaluated and `None` is replaced with its type.
+    The annotation is resolved on its own, so parameters defaulting to `None` are not turned into
+    `Optional` on Python versions before 3.11.
+
+    :param annotation: The annotation to resolve.
+    :type annotation: Any
+    :param name: The name of the parameter, or `return` for the return annotation.
+    :type name: str
+    :param _function: The function the annotation belongs to, its globals are used to resolve the annotation.
+    :type _function: Callable
+    :param _frame: The frame that called into `doc-log`, used for the log messages.
+    :type _frame: FrameType
+    :return: The resolved annotation, or the annotation as is if it could not be resolved.
+    :rtype: Any
+    """
+    if annotation is None:
+        return type(None)
+
+    if annotation is Parameter.empty:
+        return annotation
+
+    try:
+        return get_type_hints(
+            SimpleNamespace(__annotations__={name: annotation}),
+            globalns=getattr(_function, "__globals__", None),
+        )[name]
+    except (NameError, SyntaxError, TypeError) as error:
+        LOGGER.warning(
+            "(doc-log :: %s:%s:%s) type hint: `%s` could not be resolved for function: `%s`, using the annotation as is: %s",
+            _frame.f_code.co_name,
+            _function.__code__.co_firstlineno + 1,
+            _frame.f_lineno,
+            name,
+            _function.__name__,
+            error,
         )
-        if hasattr(_signature.return_annotation, "_name"):
-            return_types.items.append(
-                _resolve_nested_type_hint(_signature.return_annotation)
+        return annotation
+
+
+def _parse_type_hints(
+    _function: Callable, _frame: FrameType
+) -> Tuple[Section, Section]:
+    """Parse type hints from the function signature.
+
+    :param _function: The function to extract the type hints from.
+    :type _function: Callable
+    :param _frame: The frame that called into `doc-log`, used for the log messages.
+    :type _frame: FrameType
+    :return: The type hints if the function is inspectable.
+    :rtype: Tuple[Section, Section]
+    """
+
+    _signature = signature(_function)
+
+    return_types = Section(
+        section="rtypes", items=[], _function=_function.__code__, lineno=0
+    )
+    _return_annotation = _resolve_annotation(
+        _signature.return_annotation, name="return", _function=_function, _frame=_frame
+    )
+    if hasattr(_return_annotation, "_name"):
+        return_types.items.append(
+            _resolve_nested_type_hint(
+                _return_annotation, _function=_function, _frame=_frame
             )
-        else:
-            _type_hint = _signature.return_annotation
-            return_types.items.append(
-                SectionItem(
-                    value=_sanitize_type_hint(
+        )
+    else:
+        _type_hint = _return_annotation
+        return_types.items.append(
+            SectionItem(
+                value=_sanitize_type_hint(
+                    (
                         _type_hint.__name__
                         if hasattr(_type_hint, "__name__")
                         else _type_hint
                     ),
-                    _subitems=[],
-                    lineno=0,
-                )
+                    _function=_function,
+                    _frame=_frame,
+                ),
+                _subitems=(),
+                lineno=0,
             )
+        )
 
-        parameters_types = Section(
-            section="types", items=[], _function=_function.__code__, lineno=0
+    parameters_types = Section(
+        section="types", items=[], _function=_function.__code__, lineno=0
+    )
+    for parameter in _signature.parameters.values():
+        _annotation = _resolve_annotation(
+            parameter.annotation,
+            name=parameter.name,
+            _function=_function,
+            _frame=_frame,
         )
-        for parameter in _signature.parameters.values():
-            if hasattr(parameter.annotation, "_name"):
-                parameters_types.items.append(
-                    _resolve_nested_type_hint(
-                        type_hint=parameter.annotation, name=parameter.name
-                    )
+        if hasattr(_annotation, "_name"):
+            parameters_types.items.append(
+                _resolve_nested_type_hint(
+                    type_hint=_annotation,
+                    name=parameter.name,
+                    _function=_function,
+                    _frame=_frame,
                 )
-            else:
-                _type_hint = parameter.annotation
-                parameters_types.items.append(
-                    SectionItem(
-                        value=_sanitize_type_hint(
+            )
+        else:
+            _type_hint = _annotation
+            parameters_types.items.append(
+                SectionItem(
+                    value=_sanitize_type_hint(
+                        (
                             _type_hint.__name__
                             if hasattr(_type_hint, "__name__")
                             else _type_hint
                         ),
-                        name=parameter.name,
-                        _subitems=[],
-                        lineno=0,
-                    )
-                )
-
-        return parameters_types, return_types
-
-    def _parse_type_hints_docstring(types: Section) -> Section:
-        """Parse type hints from the function docstring and resolve them.
-
-        :param types: Types defined in the docstring.
-        :type types: Section
-        :return: The type hints if the function is inspectable.
-        :rtype: Section
-        """
-
-        def _resolve_type_hints(type_hint: str, name: str, lineno: int) -> SectionItem:
-            """Recursively search through the type hint and extract each type and it's subitems.
-
-            :param type_hint: The type hint to parse out items from.
-            :type type_hint: str
-            :param name: The name of the initial variable if applicable.
-            :type name: str
-            :param lineno: The line number in the docstring.
-            :type lineno: int
-            :return: The initial section item containing nested subitems if they exist.
-            :rtype: SectionItem
-            """
-            _container_type = compile(r"[a-zA-Z0-9\_]*(?=\[)").search(type_hint)
-            if _container_type is not None:
-                _section_item = SectionItem(
-                    value=_sanitize_type_hint(
-                        _container_type.group().strip(), lineno=lineno
+                        _function=_function,
+                        _frame=_frame,
                     ),
-                    name=name,
-                    _subitems=[],
-                    lineno=lineno,
+                    name=parameter.name,
+                    _subitems=(),
+                    lineno=0,
                 )
+            )
 
-                _nested_types = compile(r"(?<=\[).*").search(type_hint)
-                if _nested_types is not None and _nested_types.group().endswith("]"):
-                    _nested_level, _start_index = 0, 0
-                    for index, char in enumerate(_nested_types.group()[:-1] + ","):
-                        if char == "," and _nested_level == 0:
-                            _section_item._subitems.append(
-                                _resolve_type_hints(
-                                    type_hint=_nested_types.group()[:-1][
-                                        _start_index:index
-                                    ].strip(),
-                                    name=None,
-                                    lineno=lineno,
-                                )
-                            )
-                            _start_index = index + 1
-                        else:
-                            if char == "[":
-                                _nested_level += 1
-                            elif char == "]":
-                                _nested_level -= 1
-
-                else:
-                    LOGGER.warning(
-                        "(doc-log :: {!s}:{!s}:{!s}) parameter: `{!s}` was a container type but no nested type was found, or it was otherwise malformed.".format(
-                            _frame.f_code.co_name,
-                            _function.__code__.co_firstlineno + 1 + lineno,
-                            _frame.f_lineno,
-                            name,
+    return parameters_types, return_types
+
+
+def _resolve_type_hints(
+    type_hint: str, name: str, lineno: int, _function: Callable, _frame: FrameType
+) -> SectionItem:
+    """Recursively search through the type hint and extract each type and it's subitems.
+
+    :param type_hint: The type hint to parse out items from.
+    :type type_hint: str
+    :param name: The name of the initial variable if applicable.
+    :type name: str
+    :param lineno: The line number in the docstring.
+    :type lineno: int
+    :param _function: The called function that should be inspected for docstring and type hints.
+    :type _function: Callable
+    :param _frame: The frame that called into `doc-log`, used for the log messages.
+    :type _frame: FrameType
+    :return: The initial section item containing nested subitems if they exist.
+    :rtype: SectionItem
+    """
+    _subitems = []
+    _container_type = _CONTAINER_TYPE_PATTERN.search(type_hint)
+    if _container_type is not None:
+        _value = _sanitize_type_hint(
+            _container_type.group().strip(),
+            lineno=lineno,
+            _function=_function,
+            _frame=_frame,
+        )
+
+        _nested_types = _NESTED_TYPES_PATTERN.search(type_hint)
+        if _nested_types is not None and _nested_types.group().endswith("]"):
+            _nested_type_hints = _nested_types.group()[:-1]
+            # Only the brackets and commas are visited, the nested types are split on the top level commas.
+            _nested_level, _start_index = 0, 0
+            for _delimiter in _TYPE_DELIMITERS_PATTERN.finditer(
+                _nested_type_hints + ","
+            ):
+                char = _delimiter.group()
+                if char == "[":
+                    _nested_level += 1
+                elif char == "]":
+                    _nested_level -= 1
+                elif _nested_level == 0:
+                    _subitems.append(
+                        _resolve_type_hints(
+                            type_hint=_nested_type_hints[
+                                _start_index : _delimiter.start()
+                            ].strip(),
+                            name=None,
+                            lineno=lineno,
+                            _function=_function,
+                            _frame=_frame,
                         )
                     )
-            else:
-                _section_item = SectionItem(
-                    value=_sanitize_type_hint(type_hint, lineno=lineno),
-                    name=name,
-                    _subitems=[],
-                    lineno=lineno,
-                )
-
-            return _section_item
+                    _start_index = _delimiter.end()
 
-        _types = Section(
-            section=types.section,
-            items=[],
-            _function=_function.__code__,
-            lineno=types.lineno,
+        else:
+            LOGGER.warning(
+                "(doc-log :: %s:%s:%s) parameter: `%s` was a container type but no nested type was found, or it was otherwise malformed.",
+                _frame.f_code.co_name,
+                _function.__code__.co_firstlineno + 1 + lineno,
+                _frame.f_lineno,
+                name,
+            )
+    else:
+        _value = _sanitize_type_hint(
+            type_hint, lineno=lineno, _function=_function, _frame=_frame
         )
-        for section_item in types.items:
-            _types.items.append(
-                _resolve_type_hints(
-                    section_item.value, section_item.name, section_item.lineno
-                )
+
+    return SectionItem(
+        value=_value, name=name, _subitems=tuple(_subitems), lineno=lineno
+    )
+
+
+def _parse_type_hints_docstring(
+    types: Section, _function: Callable, _frame: FrameType
+) -> Section:
+    """Parse type hints from the function docstring and resolve them.
+
+    :param types: Types defined in the docstring.
+    :type types: Section
+    :param _function: The called function that should be inspected for docstring and type hints.
+    :type _function: Callable
+    :param _frame: The frame that called into `doc-log`, used for the log messages.
+    :type _frame: FrameType
+    :return: The type hints if the function is inspectable.
+    :rtype: Section
+    """
+
+    _types = Section(
+        section=types.section,
+        items=[],
+        _function=_function.__code__,
+        lineno=types.lineno,
+    )
+    for section_item in types.items:
+        _types.items.append(
+            _resolve_type_hints(
+                section_item.value,
+                section_item.name,
+                section_item.lineno,
+                _function=_function,
+                _frame=_frame,
             )
+        )
 
-        return _types
-
-    def _parse_multiline(
-        _function: Callable,
-        sections: Dict[str, SectionPattern],
-        _convert_to_oneline: Optional[Dict[str, Section]] = None,
-    ) -> Union[Dict[str, Section], None]:
-        """General multiline docstring parser. Takes an initial docstring and converts it given
-        the specified syntax rules as defined by the sections. Optionally convert to oneline items if provided.
-
-        :param _function: The called function that should be inspected for docstring and type hints.
-        :type _function: Callable
-        :param sections: The sections describing what sections there are and how to parse them.
-        :type sections: Dict[str, SectionPattern]
-        :param _convert_to_oneline: If the docstring contains multiline items then convert them given and parse using updated sections, defaults to None
-        :type _convert_to_oneline: Optional[Dict[str, Section]], optional
-        :return: The parsed docstring into their respective sections.
-        :rtype: Union[Dict[str, Section], None]
-        """
-        if not _function.__doc__:
-            LOGGER.error(
-                "(doc-log :: {!s}:{!s}:{!s}) docstring was not found for function: `{!s}` in `{!s}`".format(
-                    _frame.f_code.co_name,
-                    _function.__code__.co_firstlineno + 1,
-                    _frame.f_lineno,
-                    _function.__name__,
-                    getmodule(_function).__file__,
-                )
+    return _types
+
+
+def _parse_multiline(
+    _function: Callable,
+    _frame: FrameType,
+    dialect: str,
+    sections: Dict[str, SectionPattern],
+    sections_pattern: Pattern,
+    _convert_to_oneline: Optional[Dict[str, SectionPattern]] = None,
+) -> Union[Dict[str, Section], None]:
+    """General multiline docstring parser. Takes an initial docstring and converts it given
+    the specified syntax rules as defined by the sections. Optionally convert to oneline items if provided.
+
+    :param _function: The called function that should be inspected for docstring and type hints.
+    :type _function: Callable
+    :param _frame: The frame that called into `doc-log`, used for the log messages.
+    :type _frame: FrameType
+    :param dialect: The dialect of the docstring, used for the log messages.
+    :type dialect: str
+    :param sections: The sections describing what sections there are and how to parse them.
+    :type sections: Dict[str, SectionPattern]
+    :param sections_pattern: The combined pattern of the sections.
+    :type sections_pattern: Pattern
+    :param _convert_to_oneline: If the docstring contains multiline items then convert them given and parse using updated sections, defaults to None
+    :type _convert_to_oneline: Optional[Dict[str, SectionPattern]], optional
+    :return: The parsed docstring into their respective sections.
+    :rtype: Union[Dict[str, Section], None]
+    """
+    if not _function.__doc__:
+        LOGGER.error(
+            "(doc-log :: %s:%s:%s) docstring was not found for function: `%s` in `%s`",
+            _frame.f_code.co_name,
+            _function.__code__.co_firstlineno + 1,
+            _frame.f_lineno,
+            _function.__name__,
+            _get_module_file(_function),
+        )
+        return None
+
+    # Lines are stripped once here, the parsing steps below only read them.
+    split_docstring = {
+        index: line
+        for index, line in (
+            (index, line.strip())
+            for index, line in enumerate(_function.__doc__.splitlines())
+        )
+        if line
+    }
+    section_indexes = _parse_section_indexes(
+        docstring=split_docstring, sections_pattern=sections_pattern
+    )
+    if not section_indexes:
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "(doc-log :: %s:%s:%s) no sections were found with dialect: `%s` in function: `%s` in `%s`",
+                _frame.f_code.co_name,
+                _function.__code__.co_firstlineno + 1,
+                _frame.f_lineno,
+                dialect,
+                _function.__name__,
+                _get_module_file(_function),
             )
-            return None
 
-        split_docstring = {
-            index: line
-            for index, line in enumerate(_function.__doc__.split("\n"))
-            if line.strip()
-        }
+        sections = {}
+    else:
         if _convert_to_oneline is not None:
-            split_docstring = _convert_to_oneline_items(
-                docstring=split_docstring, sections=sections
+            split_docstring, section_indexes = _convert_to_oneline_items(
+                docstring=split_docstring, section_indexes=section_indexes
             )
             sections = _convert_to_oneline
 
-        section_indexes = _parse_section_indexes(
-            docstring=split_docstring, sections=sections
-        )
-
         sections = _collect_sections(
             docstring=split_docstring,
             section_indexes=section_indexes,
             sections=sections,
+            _function=_function,
+            _frame=_frame,
         )
 
-        if "types" in sections:
-            sections["types"] = _parse_type_hints_docstring(types=sections["types"])
-
-        if "rtypes" in sections:
-            sections["rtypes"] = _parse_type_hints_docstring(types=sections["rtypes"])
+    if "types" in sections:
+        sections["types"] = _parse_type_hints_docstring(
+            types=sections["types"], _function=_function, _frame=_frame
+        )
 
-        parsed_parameter_type_hints, parsed_return_type_hints = _parse_type_hints(
-            _function=_function,
+    if "rtypes" in sections:
+        sections["rtypes"] = _parse_type_hints_docstring(
+            types=sections["rtypes"], _function=_function, _frame=_frame
         )
 
-        if parsed_parameter_type_hints:
-            _parameter_type_hints = {
-                section_item.name: section_item
-                for section_item in parsed_parameter_type_hints.items
-            }
-
-            if "types" in sections:
-                _parameter_type_hints_docstring = {
-                    section.name: section for section in sections["types"].items
-                }
-
-                for parameter, section_item in _parameter_type_hints_docstring.items():
-                    if str(_parameter_type_hints[parameter]) != str(section_item):
-                        LOGGER.warning(
-                            "(doc-log :: {!s}:{!s}:{!s}) parameter: `{!s}` had different type hints in the docstring and in the signature, signature: `{!s}` / docstring: `{!s}`".format(
-                                _frame.f_code.co_name,
-                                _function.__code__.co_firstlineno
-                                + 1
-                                + section_item.lineno,
-                                _frame.f_lineno,
-                                parameter,
-                                _parameter_type_hints[parameter],
-                                section_item,
-                            )
-                        )
-                        _parameter_type_hints[parameter] = section_item
-            else:
-                for parameter, section_item in _parameter_type_hints.items():
-                    LOGGER.warning(
-                        "(doc-log :: {!s}:{!s}:{!s}) parameter: `{!s}` had different type hints in the docstring and in the signature, signature: `{!s}` / docstring: `_empty`".format(
-                            _frame.f_code.co_name,
-                            _function.__code__.co_firstlineno + 1 + section_item.lineno,
-                            _frame.f_lineno,
-                            parameter,
-                            _parameter_type_hints[parameter],
-                        )
-                    )
+    parsed_parameter_type_hints, parsed_return_type_hints = _parse_type_hints(
+        _function=_function, _frame=_frame
+    )
 
-            sections["types"] = Section(
-                section="types",
-                items=[section_item for section_item in _parameter_type_hints.values()],
-                _function=_function.__code__,
-                lineno=sections["types"].lineno if "types" in sections else 0,
-            )
+    if parsed_parameter_type_hints:
+        _parameter_type_hints = {
+            section_item.name: section_item
+            for section_item in parsed_parameter_type_hints.items
+        }
 
-        if parsed_return_type_hints:
-            _return_type_hints = {
-                section_item.name: section_item
-                for section_item in parsed_return_type_hints.items
-            }
-
-            if "rtypes" in sections:
-                _return_type_hints_docstring = {
-                    section.name: section for section in sections["rtypes"].items
-                }
-
-                for parameter, section_item in _return_type_hints_docstring.items():
-                    if str(_return_type_hints[parameter]) != str(section_item):
-                        LOGGER.warning(
-                            "(doc-log :: {!s}:{!s}:{!s}) return type had different type hints in the docstring and in the signature, signature: `{!s}` / docstring: `{!s}`".format(
-                                _frame.f_code.co_name,
-                                _function.__code__.co_firstlineno
-                                + 1
-                                + section_item.lineno,
-                                _frame.f_lineno,
-                                _return_type_hints[parameter],
-                                section_item,
-                            )
-                        )
-                        _return_type_hints[parameter] = section_item
-            else:
-                for parameter, section_item in _return_type_hints.items():
+        _differs = False
+        if "types" in sections:
+            for section_item in sections["types"].items:
+                parameter = section_item.name
+                if str(_parameter_type_hints[parameter]) != str(section_item):
+                    _differs = True
                     LOGGER.warning(
-                        "(doc-log :: {!s}:{!s}:{!s}) return type had different type hints in the docstring and in the signature, signature: `{!s}` / docstring: `_empty`".format(
-                            _frame.f_code.co_name,
-                            _function.__code__.co_firstlineno + 1 + section_item.lineno,
-                            _frame.f_lineno,
-                            _return_type_hints[parameter],
-                        )
+                        "(doc-log :: %s:%s:%s) parameter: `%s` had different type hints in the docstring and in the signature, signature: `%s` / docstring: `%s`",
+                        _frame.f_code.co_name,
+                        _function.__code__.co_firstlineno + 1 + section_item.lineno,
+                        _frame.f_lineno,
+                        parameter,
+                        _parameter_type_hints[parameter],
+                        section_item,
                     )
+                    _parameter_type_hints[parameter] = section_item
+        else:
+            for parameter, section_item in _parameter_type_hints.items():
+                LOGGER.warning(
+                    "(doc-log :: %s:%s:%s) parameter: `%s` had different type hints in the docstring and in the signature, signature: `%s` / docstring: `_empty`",
+                    _frame.f_code.co_name,
+                    _function.__code__.co_firstlineno + 1 + section_item.lineno,
+                    _frame.f_lineno,
+                    parameter,
+                    _parameter_type_hints[parameter],
+                )
 
-            sections["rtypes"] = Section(
-                section="rtypes",
-                items=[section_item for section_item in _return_type_hints.values()],
-                _function=_function.__code__,
-                lineno=sections["rtypes"].lineno if "rtypes" in sections else 0,
-            )
+        # The signature section is reused, its items are only replaced if the docstring overrode any.
+        if _differs:
+            parsed_parameter_type_hints.items = list(_parameter_type_hints.values())
 
-        return sections
-
-    # Most of the styles were taken from PEP257,
-    # https://stackoverflow.com/questions/3898572/what-is-the-standard-python-docstring-format
-    def _parse_pep257_multiline(_function: Callable) -> Dict[str, str]:
-        """Parse docstring and extract rules from docstrings formatted by the
-        multiline PEP257 standard.
-
-        :param _function: The called function that should be inspected for docstring and type hints.
-        :type _function: Callable
-        :return: The rules extracted from the docstring.
-        :rtype: Dict[str, str]
-        """
-        sections = {
-            "arguments": SectionPattern(
-                section=PatternDescriptor(pattern=r"^Arguments:$"),
-                name=r" .*(?=:)",
-                value=r"--\ .*$",
-            ),
-            "keywords": SectionPattern(
-                section=PatternDescriptor(pattern=r"^Keyword\ Arguments:$"),
-                name=r" .*(?=:)",
-                value=r"--\ .*$",
-            ),
-            "raises": SectionPattern(
-                section=PatternDescriptor(pattern=r"^Exceptions:$"),
-                name=r" .*(?=:)",
-                value=r"--\ .*$",
-            ),
-            "returns": SectionPattern(
-                section=PatternDescriptor(pattern=r"^Returns:$"),
-                name=r" .*(?=:)",
-                value=r"--\ .*$",
-            ),
-            "types": SectionPattern(
-                section=PatternDescriptor(pattern=r"^Types:$"),
-                name=r" .*(?=:)",
-                value=r"--\ .*$",
-            ),
-            "rtypes": SectionPattern(
-                section=PatternDescriptor(pattern=r"^Return Type:$"),
-                name=r" .*(?=:)",
-                value=r"--\ .*$",
-            ),
-        }
+        parsed_parameter_type_hints.lineno = (
+            sections["types"].lineno if "types" in sections else 0
+        )
+        sections["types"] = parsed_parameter_type_hints
 
-        sections_oneline = {
-            "arguments": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:arguments"),
-                name=r"(?<= ).*(?= --)",
-                value=r"(?<=-- ).*$",
-            ),
-            "keywords": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:keywords"),
-                name=r"(?<= ).*(?= --)",
-                value=r"(?<=-- ).*$",
-            ),
-            "types": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:types"),
-                name=r"(?<= ).*(?= --)",
-                value=r"(?<=-- ).*$",
-            ),
-            "raises": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:raises"),
-                name=r"(?<= ).*(?= --)",
-                value=r"(?<=-- ).*$",
-            ),
-            "returns": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:returns"),
-                name=r"(?<= ).*(?= --)",
-                value=r"(?<=:returns ).*$",
-            ),
-            "rtypes": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:rtypes"),
-                name=r"(?<= ).*(?= --)",
-                value=r"(?<=:rtypes ).*$",
-            ),
+    if parsed_return_type_hints:
+        _return_type_hints = {
+            section_item.name: section_item
+            for section_item in parsed_return_type_hints.items
         }
 
-        return _parse_multiline(
-            _function=_function,
-            sections=sections,
-            _convert_to_oneline=sections_oneline,
-        )
+        _differs = False
+        if "rtypes" in sections:
+            for section_item in sections["rtypes"].items:
+                parameter = section_item.name
+                if str(_return_type_hints[parameter]) != str(section_item):
+                    _differs = True
+                    LOGGER.warning(
+                        "(doc-log :: %s:%s:%s) return type had different type hints in the docstring and in the signature, signature: `%s` / docstring: `%s`",
+                        _frame.f_code.co_name,
+                        _function.__code__.co_firstlineno + 1 + section_item.lineno,
+                        _frame.f_lineno,
+                        _return_type_hints[parameter],
+                        section_item,
+                    )
+                    _return_type_hints[parameter] = section_item
+        else:
+            for parameter, section_item in _return_type_hints.items():
+                LOGGER.warning(
+                    "(doc-log :: %s:%s:%s) return type had different type hints in the docstring and in the signature, signature: `%s` / docstring: `_empty`",
+                    _frame.f_code.co_name,
+                    _function.__code__.co_firstlineno + 1 + section_item.lineno,
+                    _frame.f_lineno,
+                    _return_type_hints[parameter],
+                )
 
-    def _parse_epytext_multiline(_function: Callable) -> Dict[str, str]:
-        """Parse docstring and extract rules from docstrings formatted by the
-        multiline Epytext standard.
-
-        :param _function: The called function that should be inspected for docstring and type hints.
-        :type _function: Callable
-        :return: The rules extracted from the docstring.
-        :rtype: Dict[str, str]
-        """
-        sections = {
-            "arguments": SectionPattern(
-                section=PatternDescriptor(pattern=r"^@param"),
-                name=r"(?<= ).*(?=:)",
-                value=r"(?<=:) .*$",
-            ),
-            "types": SectionPattern(
-                section=PatternDescriptor(pattern=r"^@type"),
-                name=r"(?<= ).*(?=:)",
-                value=r"(?<=:) .*$",
-            ),
-            "raises": SectionPattern(
-                section=PatternDescriptor(pattern=r"^@raise"),
-                name=r"(?<= ).*(?=:)",
-                value=r"(?<=:) .*$",
-            ),
-            "returns": SectionPattern(
-                section=PatternDescriptor(pattern=r"^@return"),
-                value=r"(?<=:) .*$",
-            ),
-            "rtypes": SectionPattern(
-                section=PatternDescriptor(pattern=r"^@rtype"),
-                value=r"(?<=:) .*$",
-            ),
-        }
+        # The signature section is reused, its items are only replaced if the docstring overrode any.
+        if _differs:
+            parsed_return_type_hints.items = list(_return_type_hints.values())
 
-        return _parse_multiline(
-            _function=_function,
-            sections=sections,
+        parsed_return_type_hints.lineno = (
+            sections["rtypes"].lineno if "rtypes" in sections else 0
         )
+        sections["rtypes"] = parsed_return_type_hints
 
-    def _parse_rest_multiline(_function: Callable) -> Dict[str, str]:
-        """Parse docstring and extract rules from docstrings formatted by the
-        multiline reST standard.
-
-        :param _function: The called function that should be inspected for docstring and type hints.
-        :type _function: Callable
-        :return: The rules extracted from the docstring.
-        :rtype: Dict[str, str]
-        """
-        sections = {
-            "arguments": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:param"),
-                name=r"(?<= ).*(?=:)",
-                value=r"(?<=: ).*$",
-            ),
-            "types": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:type"),
-                name=r"(?<= ).*(?=:)",
-                value=r"(?<=: ).*$",
-            ),
-            "returns": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:return"),
-                value=r"(?<=: ).*$",
-            ),
-            "rtypes": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:rtype"),
-                value=r"(?<=: ).*$",
-            ),
-        }
+    return sections
 
-        return _parse_multiline(
-            _function=_function,
-            sections=sections,
-        )
 
-    def _parse_google_multiline(_function: Callable) -> Dict[str, str]:
-        """Parse docstring and extract rules from docstrings formatted by the
-        multiline Google standard.
-
-        :param _function: The called function that should be inspected for docstring and type hints.
-        :type _function: Callable
-        :return: The rules extracted from the docstring.
-        :rtype: Dict[str, str]
-        """
-        sections = {
-            "arguments": SectionPattern(
-                section=PatternDescriptor(pattern=r"^Args:$"),
-                name=r"(?<= ).*(?=:)",
-                value=r"(?<=: ).*$",
-            ),
-            "types": SectionPattern(
-                section=PatternDescriptor(pattern=r"^Types:$"),
-                name=r"(?<= ).*(?=:)",
-                value=r"(?<=: ).*$",
-            ),
-            "raises": SectionPattern(
-                section=PatternDescriptor(pattern=r"^Raises:$"),
-                name=r"(?<= ).*(?=:)",
-                value=r"(?<=: ).*$",
-            ),
-            "returns": SectionPattern(
-                section=PatternDescriptor(pattern=r"^Returns:$"),
-                value=r"(?<=: ).*$",
-            ),
-            "rtypes": SectionPattern(
-                section=PatternDescriptor(pattern=r"^Return Type:$"),
-                value=r"(?<=: ).*$",
-            ),
-        }
+def _parse_pep257_multiline(_function: Callable, _frame: FrameType) -> Dict[str, str]:
+    """Parse docstring and extract rules from docstrings formatted by the
+    multiline PEP257 standard.
 
-        sections_oneline = {
-            "arguments": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:arguments"),
-                name=r"(?<= ).*(?=:)",
-                value=r"(?<=: ).*$",
-            ),
-            "types": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:types"),
-                name=r"(?<= ).*(?=:)",
-                value=r"(?<=: ).*$",
-            ),
-            "raises": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:raises"),
-                name=r"(?<= ).*(?=:)",
-                value=r"(?<=: ).*$",
-            ),
-            "returns": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:returns"),
-                name=r"(?<= ).*(?=:)",
-                value=r"(?<=:returns ).*$",
-            ),
-            "rtypes": SectionPattern(
-                section=PatternDescriptor(pattern=r"^:rtype"),
-                name=r"(?<= ).*(?=:)",
-                value=r"(?<=:rtypes ).*$",
-            ),
-        }
+    :param _function: The called function that should be inspected for docstring and type hints.
+    :type _function: Callable
+    :param _frame: The frame that called into `doc-log`, used for the log messages.
+    :type _frame: FrameType
+    :return: The rules extracted from the docstring.
+    :rtype: Dict[str, str]
+    """
+    return _parse_multiline(
+        _function=_function,
+        _frame=_frame,
+        dialect="pep257",
+        sections=_PEP257_SECTIONS,
+        sections_pattern=_PEP257_SECTIONS_PATTERN,
+        _convert_to_oneline=_PEP257_SECTIONS_ONELINE,
+    )
 
-        return _parse_multiline(
-            _function=_function,
-            sections=sections,
-            _convert_to_oneline=sections_oneline,
+
+def _parse_epytext_multiline(_function: Callable, _frame: FrameType) -> Dict[str, str]:
+    """Parse docstring and extract rules from docstrings formatted by the
+    multiline Epytext standard.
+
+    :param _function: The called function that should be inspected for docstring and type hints.
+    :type _function: Callable
+    :param _frame: The frame that called into `doc-log`, used for the log messages.
+    :type _frame: FrameType
+    :return: The rules extracted from the docstring.
+    :rtype: Dict[str, str]
+    """
+    return _parse_multiline(
+        _function=_function,
+        _frame=_frame,
+        dialect="epytext",
+        sections=_EPYTEXT_SECTIONS,
+        sections_pattern=_EPYTEXT_SECTIONS_PATTERN,
+    )
+
+
+def _parse_rest_multiline(_function: Callable, _frame: FrameType) -> Dict[str, str]:
+    """Parse docstring and extract rules from docstrings formatted by the
+    multiline reST standard.
+
+    :param _function: The called function that should be inspected for docstring and type hints.
+    :type _function: Callable
+    :param _frame: The frame that called into `doc-log`, used for the log messages.
+    :type _frame: FrameType
+    :return: The rules extracted from the docstring.
+    :rtype: Dict[str, str]
+    """
+    return _parse_multiline(
+        _function=_function,
+        _frame=_frame,
+        dialect="rest",
+        sections=_REST_SECTIONS,
+        sections_pattern=_REST_SECTIONS_PATTERN,
+    )
+
+
+def _parse_google_multiline(_function: Callable, _frame: FrameType) -> Dict[str, str]:
+    """Parse docstring and extract rules from docstrings formatted by the
+    multiline Google standard.
+
+    :param _function: The called function that should be inspected for docstring and type hints.
+    :type _function: Callable
+    :param _frame: The frame that called into `doc-log`, used for the log messages.
+    :type _frame: FrameType
+    :return: The rules extracted from the docstring.
+    :rtype: Dict[str, str]
+    """
+    return _parse_multiline(
+        _function=_function,
+        _frame=_frame,
+        dialect="google",
+        sections=_GOOGLE_SECTIONS,
+        sections_pattern=_GOOGLE_SECTIONS_PATTERN,
+        _convert_to_oneline=_GOOGLE_SECTIONS_ONELINE,
+    )
+
+
+def _parse_numpydoc_multiline(_function: Callable, _frame: FrameType) -> Dict[str, str]:
+    """Parse docstring and extract rules from docstrings formatted by the
+    multiline NumpyDoc standard.
+
+    :param _function: The called function that should be inspected for docstring and type hints.
+    :type _function: Callable
+    :param _frame: The frame that called into `doc-log`, used for the log messages.
+    :type _frame: FrameType
+    :return: The rules extracted from the docstring.
+    :rtype: Dict[str, str]
+    """
+    raise NotImplementedError
+
+
+def _parse_annotations(_function: Callable, _frame: FrameType) -> Dict[str, Section]:
+    """Extract the rules directly from the type hints in the function signature,
+    the docstring is not parsed at all. Parameters without type hints are left out.
+
+    :param _function: The called function that should be inspected for type hints.
+    :type _function: Callable
+    :param _frame: The frame that called into `doc-log`, used for the log messages.
+    :type _frame: FrameType
+    :return: The `types` and `rtypes` sections extracted from the signature.
+    :rtype: Dict[str, Section]
+    """
+    sections = {}
+    for section in _parse_type_hints(_function=_function, _frame=_frame):
+        section.items = [
+            section_item
+            for section_item in section.items
+            if section_item.value != "_empty"
+        ]
+        if section.items:
+            sections[section.section] = section
+
+    return sections
+
+
+_DIALECT_PARSERS = {
+    "pep257": _parse_pep257_multiline,
+    "epytext": _parse_epytext_multiline,
+    "rest": _parse_rest_multiline,
+    "google": _parse_google_multiline,
+    "numpydoc": _parse_numpydoc_multiline,
+    "annotations": _parse_annotations,
+}
+
+
+def parse_docstring(_function: Callable, dialect: str) -> Dict[str, str]:
+    """Parse the docstring and extract the rules related to doc-log.
+    The rules are cached per function and dialect, the returned sections are shared
+    between calls and should not be modified. Use `parse_docstring.cache_clear()` to reset the cache.
+
+    :param _function: The called function that should be inspected for docstring and type hints.
+    :type _function: Callable
+    :param dialect: The dialect of the docstring to parse.
+    :type dialect: str
+    :returns: The rules extracted from the docstring.
+    :rtype: Dict[str, str]
+    """
+    return _parse_docstring(_function, dialect.lower())
+
+
+@lru_cache(maxsize=4096)
+def _parse_docstring(_function: Callable, dialect: str) -> Dict[str, str]:
+    """Parse the docstring and extract the rules related to doc-log, see `parse_docstring`.
+    The rules depend on the signature of the function as well as the docstring, so the
+    function itself is part of the cache key rather than only the docstring.
+
+    :param _function: The called function that should be inspected for docstring and type hints.
+    :type _function: Callable
+    :param dialect: The lowercase dialect of the docstring to parse.
+    :type dialect: str
+    :returns: The rules extracted from the docstring.
+    :rtype: Dict[str, str]
+    """
+    _frame = _get_context_frame()
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(
+            "(doc-log :: %s:%s:%s) parsing docstring with dialect: `%s` from function: `%s` in `%s`",
+            _frame.f_code.co_name,
+            _function.__code__.co_firstlineno + 1,
+            _frame.f_lineno,
+            dialect,
+            _function.__name__,
+            _get_module_file(_function),
         )
 
-    def _parse_numpydoc_multiline(_function: Callable) -> Dict[str, str]:
-        """Parse docstring and extract rules from docstrings formatted by the
-        multiline NumpyDoc standard.
-
-        :param _function: The called function that should be inspected for docstring and type hints.
-        :type _function: Callable
-        :return: The rules extracted from the docstring.
-        :rtype: Dict[str, str]
-        """
-        raise NotImplementedError
-
-    if dialect.lower() == "pep257":
-        return _parse_pep257_multiline(_function)
-    elif dialect.lower() == "epytext":
-        return _parse_epytext_multiline(_function)
-    elif dialect.lower() == "rest":
-        return _parse_rest_multiline(_function)
-    elif dialect.lower() == "google":
-        return _parse_google_multiline(_function)
-    elif dialect.lower() == "numpydoc":
-        return _parse_numpydoc_multiline(_function)
+    if dialect in _DIALECT_PARSERS:
+        return _DIALECT_PARSERS[dialect](_function=_function, _frame=_frame)
     else:
         raise ValueError(
-            "(doc-log :: {!s}:{!s}:{!s}) dialect type: {!s}, expected one of `pep257`, `epytext`, `rest`, `google` or `numpydoc`".format(
+            "(doc-log :: {!s}:{!s}:{!s}) dialect type: {!s}, expected one of `pep257`, `epytext`, `rest`, `google`, `numpydoc` or `annotations`".format(
                 _frame.f_code.co_name,
                 _function.__code__.co_firstlineno + 1,
                 _frame.f_lineno,
                 dialect,
             )
         )
+
+
+parse_docstring.cache_clear = _parse_docstring.cache_clear
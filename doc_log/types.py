@@ -2,14 +2,24 @@
 # -*- coding: utf-8 -*-
 
 from dataclasses import dataclass
-from collections.abc import Iterable
-from typing import Callable, Dict, Any, List, Tuple, Optional
+from itertools import chain, repeat
+from typing import Callable, Dict, Any, Iterable, List, Tuple, Optional
 import logging
 
 LOGGER = logging.getLogger()
 
 from doc_log.parser import Section, SectionItem, _get_context_frame
 
+# Values of these types are checked item by item, without going through the `Iterable` ABC.
+# Text is iterable as well but is always checked as a single value.
+_CONTAINER_TYPES = frozenset((list, tuple, set, frozenset))
+_TEXT_TYPES = frozenset((str, bytes, bytearray))
+_NONE_TYPE = type(None)
+# Checked in addition to the subitems of `Optional` type hints.
+_NONE_TYPE_ITEM = SectionItem(value="NoneType", name=None, _subitems=())
+# Type hints that are not checked by comparing the type of a value directly.
+_SPECIAL_TYPE_HINTS = frozenset(("AnyStr", "NoReturn", "Union", "Optional"))
+
 
 @dataclass
 class SectionItemTypeResult:
@@ -18,6 +28,8 @@ class SectionItemTypeResult:
     at runtime and the conclusive result from type checking.
     """
 
+    __slots__ = ("item", "result", "expected", "actual", "_subitems")
+
     item: SectionItem
     result: bool
     expected: Any
@@ -30,34 +42,99 @@ class SectionItemTypeResult:
         )
 
 
-def _type_check_value(type_hint: str, value: Any, globals_: Dict[str, Any]) -> bool:
-    """Type check a given value against a type hint. This check takes into account
-    the different capitalizations of types and other special cases.
+def _type_check_value(
+    type_hint: str, value_type: type, globals_: Dict[str, Any]
+) -> bool:
+    """Type check the type of a given value against a type hint. This check takes into account
+    the different capitalizations of types and other special cases. The type of the value is
+    passed rather than the value itself since the callers already need it for the results.
 
     :param type_hint: The type hint to check the value against.
     :type type_hint: str
-    :param value: The value to type check.
-    :type value: Any
+    :param value_type: The type of the value to type check.
+    :type value_type: type
     :param globals_: Additional custom types related to the local module.
     :type globals_: Dict[str, Any]
     :return: The result of the type checking.
     :rtype: bool
     """
     if type_hint == "AnyStr":
-        return isinstance(value, (str, bytes))
+        return issubclass(value_type, (str, bytes))
     elif type_hint == "NoReturn":
-        return value is None
+        return value_type is _NONE_TYPE
+
+    if type_hint in globals_:
+        return globals_[type_hint] is value_type
+
+    return type_hint == value_type.__name__
+
+
+def _is_flat_type_hint(item: SectionItem) -> bool:
+    """Check if a section item is a type hint without subitems that can be compared directly
+    against the type of a value, i.e. not one of the special type hints.
+
+    :param item: The section item to check.
+    :type item: SectionItem
+    :return: If the type hint of the item is flat.
+    :rtype: bool
+    """
+    return not item._subitems and item.value not in _SPECIAL_TYPE_HINTS
+
 
+def _type_check_flat_values(
+    item: SectionItem, values: Iterable[Any], globals_: Dict[str, Any]
+) -> Optional[SectionItemTypeResult]:
+    """Type check values against a flat type hint in one pass, stopping at the first invalid value.
+    The type hint is resolved once for all of the values.
+
+    :param item: The flat section item to check the values against.
+    :type item: SectionItem
+    :param values: The values to type check.
+    :type values: Iterable[Any]
+    :param globals_: Additional custom types related to the local module.
+    :type globals_: Dict[str, Any]
+    :return: The result for the first invalid value, or `None` if all values are valid.
+    :rtype: Optional[SectionItemTypeResult]
+    """
+    type_hint = item.value
     if type_hint in globals_:
-        return globals_[type_hint] == type(value)
+        _expected_type = globals_[type_hint]
+        _invalid_type = next(
+            (
+                _value_type
+                for _value_type in map(type, values)
+                if _value_type is not _expected_type
+            ),
+            None,
+        )
+    else:
+        _invalid_type = next(
+            (
+                _value_type
+                for _value_type in map(type, values)
+                if _value_type.__name__ != type_hint
+            ),
+            None,
+        )
+
+    if _invalid_type is None:
+        return None
 
-    return type_hint == type(value).__name__
+    return SectionItemTypeResult(
+        item=item,
+        result=False,
+        expected=type_hint,
+        actual=_invalid_type.__name__,
+        _subitems=[],
+    )
 
 
 def _type_check_nested_type(
-    item: SectionItem, value: Any, globals_: Dict[str, Any]
-) -> Tuple[SectionItemTypeResult, bool]:
-    """Recursively check the nested type provided from the initial item.
+    item: SectionItem, value: Any, globals_: Dict[str, Any], early_exit: bool = False
+) -> SectionItemTypeResult:
+    """Check the nested type provided from the initial item. The nested items are walked
+    with an explicit stack rather than recursively, so deeply nested values are not limited
+    by the recursion limit.
 
     :param item: Nested item.
     :type item: SectionItem
@@ -65,113 +142,200 @@ def _type_check_nested_type(
     :type value: Any
     :param globals_: Additional custom types related to the local module.
     :type globals_: Dict[str, Any]
-    :return: Tuple containing the result for each nested `SectionItem` and the result of type checking all items.
-    :rtype: Tuple[SectionItem, bool]
+    :param early_exit: Stop checking the remaining values of a container once its result is known to fail,
+        the nested results are then incomplete, defaults to False
+    :type early_exit: bool, optional
+    :return: The result for the initial item, containing the results for each nested `SectionItem`.
+    :rtype: SectionItemTypeResult
     """
+    _value_type = type(value)
     item_type_result = SectionItemTypeResult(
         item=item,
-        result=_type_check_value(item.value, value=value, globals_=globals_),
+        result=_type_check_value(item.value, _value_type, globals_=globals_),
         expected=item.value,
-        actual=type(value).__name__,
+        actual=_value_type.__name__,
         _subitems=[],
     )
 
-    if item.value in ("Union", "Optional"):
-        if item.value == "Optional":
-            item._subitems.append(
-                SectionItem(value="NoneType", name=None, _subitems=[])
-            )
-
-        _result_flag = False
-        for _item in item._subitems:
-            _item_type_check = _type_check_nested_type(
-                item=_item, value=value, globals_=globals_
-            )
-            _result_flag = _result_flag or _item_type_check.result
-            item_type_result._subitems.append(_item_type_check)
-        item_type_result.result = _result_flag
-    else:
-        if item._subitems:
-            if isinstance(value, dict):
+    # Results whose outcome depends on their subitems, in the order they were visited.
+    # Subitems are always visited after their parent, so the results are combined in reverse.
+    _combined_results = []
+    _stack = [(item_type_result, value)]
+    _pop, _push = _stack.pop, _stack.append
+    while _stack:
+        _item_type_result, _value = _pop()
+        _item = _item_type_result.item
+
+        _nested_values, _combine = (), None
+        if _item.value in ("Union", "Optional"):
+            _subitems = _item._subitems
+            if _item.value == "Optional" and (
+                not _subitems or _subitems[-1].value != "NoneType"
+            ):
+                # Docstring `Optional` hints are checked like the signature `Union[..., None]`,
+                # without changing the parsed item.
+                _subitems = (*_subitems, _NONE_TYPE_ITEM)
+
+            _nested_values = ((_subitem, _value) for _subitem in _subitems)
+            _combine = any
+        elif _item._subitems:
+            _value_type = type(_value)
+            if isinstance(_value, dict):
                 LOGGER.debug(
-                    "(doc-log) nested item was of type: `dict` with value: `{!s}`, type checking subitems: `{!s}`".format(
-                        value, item._subitems
-                    )
+                    "(doc-log) nested item was of type: `dict` with value: `%s`, type checking subitems: `%s`",
+                    _value,
+                    _item._subitems,
                 )
-                for _key in value.keys():
-                    # TODO: Add check to see if item is iterable and of expected length.
-                    _item_type_result = _type_check_nested_type(
-                        item=item._subitems[0], value=_key, globals_=globals_
-                    )
-                    item_type_result._subitems.append(_item_type_result)
-                    item_type_result.result = (
-                        item_type_result.result
-                        and _item_type_result.result == item_type_result.result
-                    )
-
-                for _value in value.values():
-                    # TODO: Add check to see if item is iterable and of expected length.
-                    _item_type_result = _type_check_nested_type(
-                        item=item._subitems[1], value=_value, globals_=globals_
-                    )
-                    item_type_result._subitems.append(_item_type_result)
-                    item_type_result.result = (
-                        item_type_result.result
-                        and _item_type_result.result == item_type_result.result
-                    )
-            elif isinstance(value, Iterable):
+                # TODO: Add check to see if item is iterable and of expected length.
+                _subitems = _item._subitems
+                if (
+                    early_exit
+                    and _item_type_result.result
+                    and len(_subitems) > 1
+                    and _is_flat_type_hint(_subitems[0])
+                    and _is_flat_type_hint(_subitems[1])
+                ):
+                    # Only the outermost result is needed, so flat keys and values are checked
+                    # in one pass each and only the first invalid one is kept as a subitem.
+                    for _subitem, _nested_values in (
+                        (_subitems[0], _value.keys()),
+                        (_subitems[1], _value.values()),
+                    ):
+                        _invalid_result = _type_check_flat_values(
+                            _subitem, _nested_values, globals_
+                        )
+                        if _invalid_result is not None:
+                            _item_type_result.result = False
+                            _item_type_result._subitems.append(_invalid_result)
+                            break
+
+                    continue
+
+                _nested_values = chain(
+                    zip(repeat(_subitems[0]), _value.keys()),
+                    (
+                        (_subitems[1], _nested_value)
+                        for _nested_value in _value.values()
+                    ),
+                )
+                _combine = all
+            elif _value_type in _CONTAINER_TYPES or (
+                _value_type not in _TEXT_TYPES and hasattr(_value_type, "__iter__")
+            ):
                 LOGGER.debug(
-                    "(doc-log) nested item was of type: `Iterable` with value: `{!s}`, type checking subitems: `{!s}`".format(
-                        value, item._subitems
-                    )
+                    "(doc-log) nested item was of type: `Iterable` with value: `%s`, type checking subitems: `%s`",
+                    _value,
+                    _item._subitems,
                 )
-                for index, _value in enumerate(value):
-                    # TODO: Add check to see if item is iterable and of expected length.
-                    if len(item._subitems) > 1:
-                        _item_type_result = _type_check_nested_type(
-                            item=item._subitems[index], value=_value, globals_=globals_
-                        )
-                    else:
-                        _item_type_result = _type_check_nested_type(
-                            item=item._subitems[0], value=_value, globals_=globals_
-                        )
-
-                    item_type_result._subitems.append(_item_type_result)
-                    item_type_result.result = (
-                        item_type_result.result
-                        and _item_type_result.result == item_type_result.result
+                # TODO: Add check to see if item is iterable and of expected length.
+                _subitems = _item._subitems
+                if len(_subitems) > 1:
+                    _nested_values = (
+                        (_subitems[index], _nested_value)
+                        for index, _nested_value in enumerate(_value)
+                    )
+                elif (
+                    early_exit
+                    and _item_type_result.result
+                    and _is_flat_type_hint(_subitems[0])
+                ):
+                    # Only the outermost result is needed, so flat values are checked in one pass
+                    # and only the first invalid value is kept as a subitem.
+                    _invalid_result = _type_check_flat_values(
+                        _subitems[0], _value, globals_
                     )
+                    if _invalid_result is not None:
+                        _item_type_result.result = False
+                        _item_type_result._subitems.append(_invalid_result)
 
+                    continue
+                else:
+                    # A single subitem applies to every value, pair them without indexing.
+                    _nested_values = zip(repeat(_subitems[0]), _value)
+
+                _combine = all
             else:
                 LOGGER.debug(
-                    "(doc-log) nested item was of non-container type with value: `{!s}`, type checking: `{!s}`".format(
-                        value, item._subitems[0]
-                    )
+                    "(doc-log) nested item was of non-container type with value: `%s`, type checking: `%s`",
+                    _value,
+                    _item._subitems[0],
                 )
-                item_type_result._subitems.append(
+                _subitem = _item._subitems[0]
+                _item_type_result._subitems.append(
                     SectionItemTypeResult(
-                        item=item._subitems[0],
+                        item=_subitem,
                         result=_type_check_value(
-                            item._subitems[0].value, value=value, globals_=globals_
+                            _subitem.value, _value_type, globals_=globals_
                         ),
-                        expected=item._subitems[0].value,
-                        actual=type(value).__name__,
+                        expected=_subitem.value,
+                        actual=_item_type_result.actual,
                         _subitems=[],
                     )
                 )
-                item_type_result.result = (
-                    item_type_result.result
-                    and item._subitems[0].value == type(value).__name__
+                _item_type_result.result = (
+                    _item_type_result.result
+                    and _subitem.value == _item_type_result.actual
                 )
 
+        if _combine is None:
+            continue
+
+        _combined_results.append((_item_type_result, _combine))
+        if early_exit and _combine is all and not _item_type_result.result:
+            continue
+
+        _append_subitem = _item_type_result._subitems.append
+        for _subitem, _nested_value in _nested_values:
+            _nested_value_type = type(_nested_value)
+            _subitem_type_result = SectionItemTypeResult(
+                item=_subitem,
+                result=_type_check_value(
+                    _subitem.value, _nested_value_type, globals_=globals_
+                ),
+                expected=_subitem.value,
+                actual=_nested_value_type.__name__,
+                _subitems=[],
+            )
+            _append_subitem(_subitem_type_result)
+            _push((_subitem_type_result, _nested_value))
+            if (
+                early_exit
+                and _combine is all
+                and not _subitem_type_result.result
+                and _subitem.value not in ("Union", "Optional")
+            ):
+                # A failed subitem can not pass once its own subitems are checked, unless it is a union.
+                break
+
+            if (
+                early_exit
+                and _combine is any
+                and _subitem_type_result.result
+                and not _subitem._subitems
+            ):
+                # A passed subitem without subitems of its own decides the union.
+                break
+
+    for _item_type_result, _combine in reversed(_combined_results):
+        _subitems_result = _combine(
+            _subitem_type_result.result
+            for _subitem_type_result in _item_type_result._subitems
+        )
+        if _combine is any:
+            # Union types are decided by their subitems alone.
+            _item_type_result.result = _subitems_result
+        else:
+            _item_type_result.result = _item_type_result.result and _subitems_result
+
     return item_type_result
 
 
 def type_check_arguments(
     types: Section,
-    parameters: Dict[str, Any] = {},
+    parameters: Optional[Dict[str, Any]] = None,
     arguments: Tuple[Any] = (),
-    globals_: Optional[Dict[str, Any]] = globals(),
+    globals_: Optional[Dict[str, Any]] = None,
+    early_exit: bool = False,
 ) -> Dict[str, SectionItemTypeResult]:
     """Check argument types for the given section to the actual types of the parameters.
 
@@ -180,16 +344,19 @@ def type_check_arguments(
     :param _function: The function signature, used in order to provide correct logging.
     :type _function: Callable
     :param parameters: The keyword arguments to be checked.
-    :type parameters: Dict[str, Any], optional
+    :type parameters: Optional[Dict[str, Any]], optional
     :param arguments: The arguments to be checked.
     :type arguments: Tuple[Any]
-    :param globals_: Additional custom types related to the local module.
-    :type globals_: Optional[Dict[str, Any]]
+    :param globals_: Additional custom types related to the local module, defaults to the globals of this module
+    :type globals_: Optional[Dict[str, Any]], optional
+    :param early_exit: Stop checking the remaining values of a nested type once it is known to fail,
+        only the outermost results are then complete, defaults to False
+    :type early_exit: bool, optional
     :raises KeyError: If the `types` section is not provided as an argument.
-    :return: The results for the parameter types.
+    :return: The results for the provided parameters that were type hinted, in the order they were provided.
     :rtype: Dict[str, SectionItemTypeResult]
     """
-    _frame = _get_context_frame().frame
+    _frame = _get_context_frame()
     if types.section != "types":
         raise KeyError(
             "(doc-log :: {!s}:{!s}:{!s}) provided section needs to be of type: `types`".format(
@@ -199,7 +366,15 @@ def type_check_arguments(
             )
         )
 
+    if parameters is None:
+        parameters = {}
+
+    if globals_ is None:
+        globals_ = globals()
+
     if arguments:
+        # Guessed arguments are added to a copy, the provided parameters are never modified.
+        parameters = dict(parameters)
         for index, section_item in enumerate(
             [
                 _section_item
@@ -211,96 +386,90 @@ def type_check_arguments(
                 break
 
             LOGGER.warning(
-                "(doc-log :: {!s}:{!s}:{!s}) argument was passed as non-keyword guessing: `{!s} := {!r}`".format(
-                    _frame.f_code.co_name,
-                    types._function.co_firstlineno + 1 + section_item.lineno,
-                    _frame.f_lineno,
-                    section_item.name,
-                    arguments[index],
-                )
+                "(doc-log :: %s:%s:%s) argument was passed as non-keyword guessing: `%s := %r`",
+                _frame.f_code.co_name,
+                types._function.co_firstlineno + 1 + section_item.lineno,
+                _frame.f_lineno,
+                section_item.name,
+                arguments[index],
             )
             parameters[section_item.name] = arguments[index]
 
-    _consumed = set()
-    type_check_results = {
-        parameter: SectionItemTypeResult(
-            item=None, result=False, expected=Any, actual=None, _subitems=[]
-        )
-        for parameter in parameters
-    }
+    _section_items = {section_item.name: section_item for section_item in types.items}
     for section_item in types.items:
         if section_item.name not in parameters:
             # TODO: Don't warn if the parameter is optional.
             LOGGER.warning(
-                "(doc-log :: {!s}:{!s}:{!s}) parameter: `{!s}` was type hinted, but not provided as a parameter.".format(
-                    _frame.f_code.co_name,
-                    types._function.co_firstlineno + 1 + section_item.lineno,
-                    _frame.f_lineno,
-                    section_item.name,
-                )
+                "(doc-log :: %s:%s:%s) parameter: `%s` was type hinted, but not provided as a parameter.",
+                _frame.f_code.co_name,
+                types._function.co_firstlineno + 1 + section_item.lineno,
+                _frame.f_lineno,
+                section_item.name,
             )
+
+    type_check_results = {}
+    for parameter, _value in parameters.items():
+        section_item = _section_items.get(parameter)
+        if section_item is None:
             continue
 
-        _consumed.add(section_item.name)
         if section_item._subitems:
             LOGGER.debug(
-                "(doc-log :: {!s}:{!s}:{!s}) item: `{!s}` is nested, type checking subitems".format(
-                    _frame.f_code.co_name,
-                    types._function.co_firstlineno + 1 + section_item.lineno,
-                    _frame.f_lineno,
-                    section_item,
-                )
+                "(doc-log :: %s:%s:%s) item: `%s` is nested, type checking subitems",
+                _frame.f_code.co_name,
+                types._function.co_firstlineno + 1 + section_item.lineno,
+                _frame.f_lineno,
+                section_item,
             )
-            _section_item = _type_check_nested_type(
-                section_item, value=parameters[section_item.name], globals_=globals_
+            type_check_results[parameter] = _type_check_nested_type(
+                section_item, value=_value, globals_=globals_, early_exit=early_exit
             )
-            type_check_results[section_item.name] = _section_item
         else:
             LOGGER.debug(
-                "(doc-log :: {!s}:{!s}:{!s}) item: `{!s}` is not nested, type checking directly against value: `{!r}`".format(
-                    _frame.f_code.co_name,
-                    types._function.co_firstlineno + 1 + section_item.lineno,
-                    _frame.f_lineno,
-                    section_item,
-                    parameters[section_item.name],
-                )
+                "(doc-log :: %s:%s:%s) item: `%s` is not nested, type checking directly against value: `%r`",
+                _frame.f_code.co_name,
+                types._function.co_firstlineno + 1 + section_item.lineno,
+                _frame.f_lineno,
+                section_item,
+                _value,
             )
-            _parameter_type = type(parameters[section_item.name]).__name__
-            type_check_results[section_item.name] = SectionItemTypeResult(
+            _value_type = type(_value)
+            type_check_results[parameter] = SectionItemTypeResult(
                 item=section_item,
                 result=_type_check_value(
-                    section_item.value, parameters[section_item.name], globals_=globals_
+                    section_item.value, _value_type, globals_=globals_
                 ),
                 expected=section_item.value,
-                actual=_parameter_type,
+                actual=_value_type.__name__,
                 _subitems=[],
             )
 
-    if len(_consumed) != len(parameters):
+    if len(type_check_results) != len(parameters):
         LOGGER.warning(
-            "(doc-log :: {!s}:{!s}:{!s}) parameters that were not type hinted was passed, consumed: `{!s}`, passed: `{!s}`".format(
-                _frame.f_code.co_name,
-                types._function.co_firstlineno + 1 + types.lineno,
-                _frame.f_lineno,
-                ", ".join(_consumed),
-                ", ".join(parameters),
-            )
-        )
-
-    # TODO: Log this in a better format.
-    LOGGER.debug(
-        "(doc-log :: {!s}:{!s}:{!s}) type check arguments results was: `{!r}`".format(
+            "(doc-log :: %s:%s:%s) parameters that were not type hinted was passed, consumed: `%s`, passed: `%s`",
             _frame.f_code.co_name,
             types._function.co_firstlineno + 1 + types.lineno,
             _frame.f_lineno,
-            type_check_results,
+            ", ".join(type_check_results),
+            ", ".join(parameters),
         )
+
+    # TODO: Log this in a better format.
+    LOGGER.debug(
+        "(doc-log :: %s:%s:%s) type check arguments results was: `%r`",
+        _frame.f_code.co_name,
+        types._function.co_firstlineno + 1 + types.lineno,
+        _frame.f_lineno,
+        type_check_results,
     )
     return type_check_results
 
 
 def type_check_rtypes(
-    rtypes: Section, results: Any, globals_: Optional[Dict[str, Any]] = globals()
+    rtypes: Section,
+    results: Any,
+    globals_: Optional[Dict[str, Any]] = None,
+    early_exit: bool = False,
 ) -> Tuple[SectionItemTypeResult]:
     """Check return types for the given section to the actual types of the output.
 
@@ -308,61 +477,67 @@ def type_check_rtypes(
     :type rtypes: Section
     :param results: The output values to be checked.
     :type results: List[Any]
-    :param globals_: Additional custom types related to the local module.
-    :type globals_: Optional[Dict[str, Any]]
+    :param globals_: Additional custom types related to the local module, defaults to the globals of this module
+    :type globals_: Optional[Dict[str, Any]], optional
+    :param early_exit: Stop checking the remaining values of a nested type once it is known to fail,
+        only the outermost results are then complete, defaults to False
+    :type early_exit: bool, optional
     :raises KeyError: If the `rtypes` section is not provided as an argument.
     :return: The results for each return type.
     :rtype: Tuple[SectionItemTypeResult]
     """
-    _frame = _get_context_frame().frame
+    _frame = _get_context_frame()
     if rtypes.section != "rtypes":
         raise KeyError("Provided section needs to be of type: `rtypes`")
 
-    type_check_results = SectionItemTypeResult(
-        item=None, result=False, expected=Any, actual=None, _subitems=[]
-    )
+    if globals_ is None:
+        globals_ = globals()
 
+    type_check_results = None
     for section_item in rtypes.items:
         if section_item._subitems:
             LOGGER.debug(
-                "(doc-log :: {!s}:{!s}:{!s}) return type: `{!s}` is nested, type checking subitems".format(
-                    _frame.f_code.co_name,
-                    rtypes._function.co_firstlineno + 1 + section_item.lineno,
-                    _frame.f_lineno,
-                    section_item,
-                )
+                "(doc-log :: %s:%s:%s) return type: `%s` is nested, type checking subitems",
+                _frame.f_code.co_name,
+                rtypes._function.co_firstlineno + 1 + section_item.lineno,
+                _frame.f_lineno,
+                section_item,
             )
             type_check_results = _type_check_nested_type(
-                section_item, value=results, globals_=globals_
+                section_item, value=results, globals_=globals_, early_exit=early_exit
             )
         else:
             LOGGER.debug(
-                "(doc-log :: {!s}:{!s}:{!s}) return type: `{!s}` is not nested, type checking directly against value: `{!r}`".format(
-                    _frame.f_code.co_name,
-                    rtypes._function.co_firstlineno + 1 + section_item.lineno,
-                    _frame.f_lineno,
-                    section_item,
-                    results,
-                )
+                "(doc-log :: %s:%s:%s) return type: `%s` is not nested, type checking directly against value: `%r`",
+                _frame.f_code.co_name,
+                rtypes._function.co_firstlineno + 1 + section_item.lineno,
+                _frame.f_lineno,
+                section_item,
+                results,
             )
-            _parameter_type = type(results).__name__
+            _results_type = type(results)
             type_check_results = SectionItemTypeResult(
                 item=section_item,
                 result=_type_check_value(
-                    section_item.value, value=results, globals_=globals_
+                    section_item.value, _results_type, globals_=globals_
                 ),
                 expected=section_item.value,
-                actual=_parameter_type,
+                actual=_results_type.__name__,
                 _subitems=[],
             )
 
+    if type_check_results is None:
+        # Nothing was type hinted as a return type.
+        type_check_results = SectionItemTypeResult(
+            item=None, result=False, expected=Any, actual=None, _subitems=[]
+        )
+
     # TODO: Log this in a better format.
     LOGGER.debug(
-        "(doc-log :: {!s}:{!s}:{!s}) type check return results was: `{!r}`".format(
-            _frame.f_code.co_name,
-            rtypes._function.co_firstlineno + 1 + rtypes.lineno,
-            _frame.f_lineno,
-            type_check_results,
-        )
+        "(doc-log :: %s:%s:%s) type check return results was: `%r`",
+        _frame.f_code.co_name,
+        rtypes._function.co_firstlineno + 1 + rtypes.lineno,
+        _frame.f_lineno,
+        type_check_results,
     )
     return type_check_results
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from typing import Dict, List
+
+import pytest
+
+from doc_log import doc_log
+from doc_log.parser import parse_docstring
+
+
+def test_parse_annotations_simple():
+    def _test_func(i: int, j: int = 0) -> int:
+        return i + j
+
+    parsed_docstring = parse_docstring(_test_func, dialect="annotations")
+    expected = {
+        "types": {"i": "int", "j": "int"},
+        "rtypes": {None: "int"},
+    }
+
+    assert set(parsed_docstring.keys()) == set(expected.keys())
+    assert all(
+        [
+            {item.name: str(item) for item in section.items}
+            == expected[section.section]
+            for section in parsed_docstring.values()
+        ]
+    )
+    assert _test_func(2, 2) == 4
+
+
+def test_parse_annotations_nested():
+    def _test_func(i: List[int], j: Dict[str, int]) -> List[int]:
+        return i + list(j.values())
+
+    parsed_docstring = parse_docstring(_test_func, dialect="annotations")
+    expected = {
+        "types": {"i": "list[int]", "j": "dict[str, int]"},
+        "rtypes": {None: "list[int]"},
+    }
+
+    assert all(
+        [
+            {item.name: str(item) for item in section.items}
+            == expected[section.section]
+            for section in parsed_docstring.values()
+        ]
+    )
+    assert _test_func([2], {"j": 2}) == [2, 2]
+
+
+def test_parse_annotations_nested_siblings():
+    def _test_func(i: Dict[str, List[int]]) -> int:
+        return len(i)
+
+    parsed_docstring = parse_docstring(_test_func, dialect="annotations")
+
+    assert str(parsed_docstring["types"].items[0]) == "dict[str, list[int]]"
+    assert _test_func({"i": [2]}) == 1
+
+
+def test_parse_annotations_partial():
+    def _test_func(i: int, j=0):
+        """Function without any docstring sections."""
+        return i + j
+
+    parsed_docstring = parse_docstring(_test_func, dialect="annotations")
+
+    assert list(parsed_docstring.keys()) == ["types"]
+    assert [item.name for item in parsed_docstring["types"].items] == ["i"]
+    assert _test_func(2, 2) == 4
+
+
+def test_parse_annotations_none_return(caplog):
+    @doc_log(dialect="annotations", type_check=True, _active_type_check=True)
+    def _test_func(i: int) -> None:
+        return None
+
+    parsed_docstring = parse_docstring(_test_func.__wrapped__, dialect="annotations")
+
+    assert str(parsed_docstring["rtypes"].items[0]) == "NoneType"
+    assert _test_func(i=2) is None
+    assert "unknown type" not in caplog.text
+
+
+def test_parse_annotations_string_annotations():
+    @doc_log(dialect="annotations", type_check=True, _active_type_check=True)
+    def _test_func(i: "List[int]", j: "Dict[str, int]") -> "List[int]":
+        return i + list(j.values())
+
+    parsed_docstring = parse_docstring(_test_func.__wrapped__, dialect="annotations")
+    expected = {
+        "types": {"i": "list[int]", "j": "dict[str, int]"},
+        "rtypes": {None: "list[int]"},
+    }
+
+    assert all(
+        [
+            {item.name: str(item) for item in section.items}
+            == expected[section.section]
+            for section in parsed_docstring.values()
+        ]
+    )
+    assert _test_func(i=[2], j={"j": 2}) == [2, 2]
+
+
+def test_parse_annotations_unresolvable_none_return():
+    @doc_log(dialect="annotations", type_check=True, _active_type_check=True)
+    def _test_func(i: int, k: "Undefined" = 1) -> None:
+        return None
+
+    parsed_docstring = parse_docstring(_test_func.__wrapped__, dialect="annotations")
+    expected = {
+        "types": {"i": "int", "k": "Undefined"},
+        "rtypes": {None: "NoneType"},
+    }
+
+    assert all(
+        [
+            {item.name: str(item) for item in section.items}
+            == expected[section.section]
+            for section in parsed_docstring.values()
+        ]
+    )
+    assert _test_func(i=2) is None
+
+
+def test_parse_annotations_none_default(caplog):
+    def _test_func(i: int, j: int = None) -> int:
+        """Function that adds two numbers and returns the result.
+
+        :param i: the first number
+        :type i: int
+        :param j: the second number
+        :type j: int
+        :return: Result of addition between `i` and `j`.
+        :rtype: int
+        """
+        return i + (j or 0)
+
+    parsed_docstring = parse_docstring(_test_func, dialect="annotations")
+
+    assert {item.name: str(item) for item in parsed_docstring["types"].items} == {
+        "i": "int",
+        "j": "int",
+    }
+
+    parse_docstring(_test_func, dialect="rest")
+    assert "different type hints" not in caplog.text
+    assert _test_func(2) == 2
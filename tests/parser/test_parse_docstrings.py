@@ -236,3 +236,36 @@ def test_parse_numpydoc_style_simple():
         )
 
     assert _test_func(2, 2) == 4
+
+
+def test_parse_cached():
+    def _test_func(i, j=0) -> int:
+        """Function that adds two numbers and returns the result.
+
+        :param i: the first number
+        :type i: int
+        :param j: the second number
+        :type j: int
+        :return: Result of addition between `i` and `j`.
+        :rtype: int
+        """
+        return i + j
+
+    parsed_docstring = parse_docstring(_test_func, dialect="rest")
+    assert parse_docstring(_test_func, dialect="reST") is parsed_docstring
+
+    parse_docstring.cache_clear()
+    assert parse_docstring(_test_func, dialect="rest") is not parsed_docstring
+    assert _test_func(2, 2) == 4
+
+
+def test_parse_pep257_style_no_sections():
+    def _test_func(i, j=0) -> int:
+        """Function that adds two numbers and returns the result."""
+        return i + j
+
+    parsed_docstring = parse_docstring(_test_func, dialect="pep257")
+
+    assert "arguments" not in parsed_docstring
+    assert [item.value for item in parsed_docstring["rtypes"].items] == ["int"]
+    assert _test_func(2, 2) == 4
@@ -162,3 +162,44 @@ def test_type_check_numpydoc_style_nested_passive():
         )
         _test_inner_types(type_check_returns)
         assert result == ((4, 5), 2)
+
+
+def test_type_check_rest_style_nested_early_exit():
+    def _test_func(i: List[int], j: Tuple[int, int], k: Dict[str, int]) -> int:
+        """Function that returns the number of items.
+
+        :param i: the numbers
+        :type i: List[int]
+        :param j: the pair of numbers
+        :type j: Tuple[int, int]
+        :param k: the named numbers
+        :type k: Dict[str, int]
+        :return: The number of items in `i`, `j` and `k`.
+        :rtype: int
+        """
+        return len(i) + len(j) + len(k)
+
+    parsed_docstring = parse_docstring(_test_func, dialect="rest")
+    type_check_results = type_check_arguments(
+        parsed_docstring["types"],
+        parameters={"i": [0, 1, 2], "j": (3, 4), "k": {"first": 5}},
+        early_exit=True,
+    )
+    _test_inner_types(type_check_results["i"])
+    _test_inner_types(type_check_results["j"])
+    _test_inner_types(type_check_results["k"])
+    assert not type_check_results["i"]._subitems
+    assert len(type_check_results["j"]._subitems) == 2
+    assert not type_check_results["k"]._subitems
+
+    type_check_results = type_check_arguments(
+        parsed_docstring["types"],
+        parameters={"k": {"first": 5, "second": "6"}},
+        early_exit=True,
+    )
+    assert not type_check_results["k"].result
+    assert list(
+        (item.result, item.expected, item.actual)
+        for item in type_check_results["k"]._subitems
+    ) == [(False, "int", "str")]
+    assert _test_func([0, 1, 2], (3, 4), {"first": 5}) == 6
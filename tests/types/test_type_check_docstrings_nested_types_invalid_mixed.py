@@ -272,3 +272,49 @@ def test_type_check_numpydoc_style_nested_invalid_mixed_passive():
         ) == [(False, "str", "int"), (False, "str", "int")]
 
         assert result == ((4, 5), 2)
+
+
+def test_type_check_rest_style_nested_invalid_early_exit():
+    def _test_func(i: List[int]) -> int:
+        """Function that returns the number of items.
+
+        :param i: the numbers
+        :type i: List[str]
+        :return: The number of items in `i`.
+        :rtype: int
+        """
+        return len(i)
+
+    parsed_docstring = parse_docstring(_test_func, dialect="rest")
+    type_check_results = type_check_arguments(
+        parsed_docstring["types"], parameters={"i": [0, 1, 2]}, early_exit=True
+    )
+    assert not type_check_results["i"].result
+    assert list(
+        (item.result, item.expected, item.actual)
+        for item in type_check_results["i"]._subitems
+    ) == [(False, "str", "int")]
+    assert _test_func([0, 1, 2]) == 3
+
+
+def test_type_check_rest_style_nested_invalid_text():
+    def _test_func(i: List[str]) -> int:
+        """Function that returns the number of items.
+
+        :param i: the words
+        :type i: List[str]
+        :return: The number of items in `i`.
+        :rtype: int
+        """
+        return len(i)
+
+    parsed_docstring = parse_docstring(_test_func, dialect="rest")
+    type_check_results = type_check_arguments(
+        parsed_docstring["types"], parameters={"i": "ab"}
+    )
+    assert not type_check_results["i"].result
+    assert list(
+        (item.result, item.expected, item.actual)
+        for item in type_check_results["i"]._subitems
+    ) == [(True, "str", "str")]
+    assert _test_func("ab") == 2
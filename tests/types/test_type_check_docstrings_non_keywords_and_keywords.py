@@ -220,3 +220,49 @@ def test_type_check_numpydoc_style_keywords_mixed_passive():
         )
 
         assert result == 4
+
+
+def test_type_check_keywords_mixed_parameters_unmodified():
+    def _test_func(i, j=0) -> int:
+        """Function that adds two numbers and returns the result.
+
+        :param i: the first number
+        :type i: int
+        :param j: the second number
+        :type j: int
+        :return: Result of addition between `i` and `j`.
+        :rtype: int
+        """
+        return i + j
+
+    parameters = {"j": 2}
+    parsed_docstring = parse_docstring(_test_func, dialect="rest")
+    type_check_results = type_check_arguments(
+        parsed_docstring["types"],
+        parameters=parameters,
+        arguments=(2,),
+    )
+    assert type_check_results["i"].result
+    assert type_check_results["j"].result
+    assert parameters == {"j": 2}
+
+
+def test_type_check_keywords_not_type_hinted():
+    def _test_func(i, **kwargs) -> int:
+        """Function that adds two numbers and returns the result.
+
+        :param i: the first number
+        :type i: int
+        :return: Result of addition between `i` and `j`.
+        :rtype: int
+        """
+        return i + kwargs["j"]
+
+    parsed_docstring = parse_docstring(_test_func, dialect="rest")
+    type_check_results = type_check_arguments(
+        parsed_docstring["types"],
+        parameters={"i": 2, "j": 2},
+    )
+    assert list(type_check_results.keys()) == ["i"]
+    assert type_check_results["i"].result
+    assert _test_func(2, j=2) == 4
@@ -128,6 +128,48 @@ def test_type_check_rest_style_special_passive():
         assert result == _result
 
 
+def test_type_check_rest_style_special_repeated():
+    def _test_func(i, j):
+        """Function that adds two numbers and returns the result.
+
+        :param i: the first number
+        :type i: Union[int, float]
+        :param j: the second number
+        :type j: Optional[int]
+        :return: Result of addition between `i` and `j`.
+        :rtype: Union[int, float]
+        """
+        if j is None:
+            j = 2
+        return i + j
+
+    for _ in range(3):
+        parsed_docstring = parse_docstring(_test_func, dialect="rest")
+        type_check_results = type_check_arguments(
+            parsed_docstring["types"],
+            parameters={"i": 2, "j": None},
+        )
+        assert type_check_results["j"].result
+        assert list(
+            (item.result, item.expected, item.actual)
+            for item in type_check_results["j"]._subitems
+        ) == [(False, "int", "NoneType"), (True, "NoneType", "NoneType")]
+        assert [str(item) for item in parsed_docstring["types"].items] == [
+            "Union[int, float]",
+            "Optional[int]",
+        ]
+
+    type_check_results = type_check_arguments(
+        parsed_docstring["types"], parameters={"i": 2, "j": None}, early_exit=True
+    )
+    assert type_check_results["i"].result
+    assert list(
+        (item.result, item.expected, item.actual)
+        for item in type_check_results["i"]._subitems
+    ) == [(True, "int", "int")]
+    assert _test_func(2, None) == 4
+
+
 def test_type_check_google_style_special_passive():
     def _test_func(i, j):
         """Function that adds two numbers and returns the result.
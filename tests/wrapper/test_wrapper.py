@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import sys
+
 import pytest
 
 from doc_log import doc_log
+from doc_log.parser import parse_docstring
 
 
 def test_wrapper_pep257_style_simple_passive():
@@ -112,3 +115,62 @@ def test_wrapper_numpydoc_style_simple_passive():
 
     with pytest.raises(NotImplementedError):
         assert _test_func(2) == 2
+
+
+def test_wrapper_disabled_type_check_returns_function():
+    def _test_func(i, j=0) -> int:
+        """Function that adds two numbers and returns the result.
+
+        Arguments:
+        i -- the first number
+
+        Types:
+        i -- int
+        """
+        return i + j
+
+    def _test_func_no_docstring(i, j=0) -> int:
+        return i + j
+
+    assert doc_log(dialect="pep257", type_check=False)(_test_func) is _test_func
+    assert (
+        doc_log(dialect="pep257", type_check=True)(_test_func_no_docstring)
+        is _test_func_no_docstring
+    )
+
+
+def test_wrapper_disabled_environment(monkeypatch):
+    monkeypatch.setattr(sys.modules["doc_log"], "_DISABLED", True)
+
+    def _test_func(i, j=0) -> int:
+        """Function that adds two numbers and returns the result.
+
+        Arguments:
+        i -- the first number
+
+        Types:
+        i -- int
+        """
+        return i + j
+
+    assert doc_log(dialect="pep257", type_check=True)(_test_func) is _test_func
+
+
+def test_wrapper_module_without_file(monkeypatch):
+    monkeypatch.setitem(sys.modules, "_doc_log_no_file", type(sys)("_doc_log_no_file"))
+
+    def _test_func(i, j=0) -> int:
+        """Function that adds two numbers and returns the result.
+
+        Arguments:
+        i -- the first number
+
+        Types:
+        i -- int
+        """
+        return i + j
+
+    for module in ("_doc_log_no_file", "_doc_log_not_imported", None):
+        _test_func.__module__ = module
+        parse_docstring.cache_clear()
+        assert doc_log(dialect="pep257", type_check=True)(_test_func)(2) == 2
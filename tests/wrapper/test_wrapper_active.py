@@ -112,3 +112,11 @@ def test_wrapper_numpydoc_style_simple_active():
 
     with pytest.raises(NotImplementedError):
         assert _test_func(2) == 2
+
+
+def test_wrapper_annotations_active():
+    @doc_log(dialect="annotations", type_check=True, _active_type_check=True)
+    def _test_func(i: int, j: int = 0) -> int:
+        return i + j
+
+    assert _test_func(2) == 2
@@ -132,3 +132,15 @@ def test_wrapper_numpydoc_style_invalid_active():
 
         with pytest.raises(TypeError):
             assert _test_func(2) == 2
+
+
+def test_wrapper_annotations_invalid_active():
+    @doc_log(dialect="annotations", type_check=True, _active_type_check=True)
+    def _test_func(i: int, j: int = 0) -> int:
+        return str(i + j)
+
+    with pytest.raises(TypeError):
+        assert _test_func("2") == 2
+
+    with pytest.raises(TypeError):
+        assert _test_func(2) == 2